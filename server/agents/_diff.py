@@ -0,0 +1,8 @@
+import difflib
+
+
+def create_diff(before: str, after: str) -> str:
+    """Create a unified diff between before and after code, or an empty string when unchanged"""
+    if before == after:
+        return ""
+    return '\n'.join(difflib.unified_diff(before.splitlines(), after.splitlines(), lineterm='', n=1))
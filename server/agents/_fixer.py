@@ -0,0 +1,107 @@
+import os
+import asyncio
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Any
+from models.job import Issue, Fix
+from agents._diff import create_diff
+from agents._llm import fix_client, is_no_op_fix, request_fixes
+from agents._rules import pattern_fix
+
+
+@dataclass(frozen=True)
+class RuleSpec:
+    """Rule-based fix for one rule_id: transform returns the fixed snippet, or None if it does not apply"""
+    transform: Callable[[str], Optional[str]]
+    confidence: float
+
+
+class RuleFixer:
+    """Shared POUR agent: fixes issues from a table of rules, then patterns, then the LLM"""
+
+    # Set by each POUR agent
+    category = ""
+    RULES: Dict[str, RuleSpec] = {}
+
+    def __init__(self):
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key or api_key == "your_openai_api_key_here":
+            raise ValueError("OPENAI_API_KEY environment variable must be set to a valid API key")
+        self.client = fix_client(api_key)
+        self.model = os.getenv("OPENAI_MODEL", "gpt-5.1")
+        # Cap concurrent LLM requests per agent to stay within OpenAI rate limits
+        self._sem = asyncio.Semaphore(int(os.getenv("POUR_AGENT_CONCURRENCY", "10")))
+        # Issues sent to the LLM in a single fix request
+        self.llm_batch_size = int(os.getenv("POUR_LLM_BATCH_SIZE", "10"))
+        # Optional cheaper model tried first; fixes below the confidence threshold go to self.model
+        self.fast_model = os.getenv("OPENAI_FAST_MODEL") or None
+        self.escalate_below = float(os.getenv("POUR_ESCALATE_CONFIDENCE", "0.6"))
+
+    async def fix_issues(self, issues: List[Issue]) -> List[Fix]:
+        """Fix issues of this agent's category; callers pass issues already grouped by category"""
+        fixes = []
+        llm_issues = []
+        for issue in issues:
+            spec = self.RULES.get(issue.rule_id)
+            if spec is not None:
+                # Rules own their rule_id: an issue they cannot fix is not sent to the LLM
+                fix = self._rule_fix(issue, spec)
+            else:
+                # Cheap deterministic patterns get a chance before the LLM
+                fix = pattern_fix(issue)
+                if fix is None:
+                    llm_issues.append(issue)
+            if fix is not None:
+                fixes.append(fix)
+
+        return fixes + await self._llm_fix_issues(llm_issues)
+
+    def _rule_fix(self, issue: Issue, spec: RuleSpec) -> Optional[Fix]:
+        """Apply a rule's transform to an issue's snippet"""
+        code = issue.code_snippet
+        new_code = spec.transform(code)
+        if new_code is None or new_code == code:
+            return None
+        return Fix(
+            issue_id=issue.id,
+            file_path=issue.file_path,
+            before_code=code,
+            after_code=new_code,
+            diff=create_diff(code, new_code),
+            confidence=spec.confidence,
+            applied=True,
+            line_start=issue.line_start,
+            line_end=issue.line_end
+        )
+
+    async def _llm_fix_issues(self, issues: List[Issue]) -> List[Fix]:
+        """Use LLM to fix issues, several per request"""
+        if not issues:
+            return []
+        fixes = await request_fixes(
+            self.client, self.model, self.category, issues, self.llm_batch_size, self._sem,
+            fast_model=self.fast_model, escalate_below=self.escalate_below
+        )
+        # Issues the LLM found not to apply get no fix rather than an unchanged "applied" one
+        return [
+            self._llm_fix(issue, fix_data)
+            for issue, fix_data in zip(issues, fixes)
+            if fix_data is not None and not is_no_op_fix(fix_data)
+        ]
+
+    def _llm_fix(self, issue: Issue, fix_data: Dict[str, Any]) -> Fix:
+        """Build the Fix for an issue from the LLM's fix data"""
+        return Fix(
+            issue_id=issue.id,
+            file_path=issue.file_path,
+            before_code=fix_data["before_code"],
+            after_code=fix_data["after_code"],
+            diff=self._llm_diff(issue, fix_data["before_code"], fix_data["after_code"]),
+            confidence=fix_data["confidence"],
+            applied=True,
+            line_start=issue.line_start,
+            line_end=issue.line_end
+        )
+
+    def _llm_diff(self, issue: Issue, before: str, after: str) -> str:
+        """Diff shown for an LLM fix"""
+        return create_diff(before, after)
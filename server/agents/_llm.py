@@ -0,0 +1,340 @@
+import os
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+import httpx
+import openai
+import orjson
+from models.job import Issue
+from agents._llm_cache import LLMCache, fix_cache
+
+# One client for every POUR agent so their concurrent requests share a connection pool
+_fix_client: Optional[openai.AsyncOpenAI] = None
+
+
+def fix_client(api_key: str) -> openai.AsyncOpenAI:
+    """Return the AsyncOpenAI client shared by the POUR agents, creating it on first use"""
+    global _fix_client
+    if _fix_client is None:
+        _fix_client = openai.AsyncOpenAI(
+            api_key=api_key,
+            http_client=httpx.AsyncClient(
+                http2=True,
+                timeout=httpx.Timeout(60.0, connect=5.0),
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+            ),
+            max_retries=2
+        )
+    return _fix_client
+
+
+async def aclose_fix_client() -> None:
+    """Close the shared client's pooled connections"""
+    global _fix_client
+    if _fix_client is not None:
+        await _fix_client.close()
+        _fix_client = None
+
+
+# Static instructions shared by every POUR fix agent. Kept free of interpolation and
+# identical across categories so the whole system message is a cacheable prefix
+# (OpenAI's automatic prompt caching needs >1024 identical leading tokens); all
+# per-issue details go in the user message.
+FIX_SYSTEM_PROMPT = """You are an accessibility engineer who repairs WCAG 2.1 violations in web source code.
+
+You will receive a JSON object in the user message with these fields:
+- "category": the POUR principle all of the issues belong to (perceivable, operable, understandable or robust)
+- "issues": an array of one or more accessibility issues, each with:
+  - "issue_index": integer identifying the issue within this request
+  - "rule_id": the identifier of the rule that flagged the issue
+  - "description": a description of what is wrong
+  - "language": the extension of the source file (.html, .jsx, .tsx, .js, .ts or .css)
+  - "lines": the 1-based line range the issue was flagged on
+  - "code": the exact source snippet to repair, starting at or shortly before the flagged lines
+
+For every issue, produce the smallest change to its snippet that resolves the issue for users of assistive technology. Treat each issue independently.
+
+General principles:
+- Preserve behaviour, styling hooks (class, className, id, data-* attributes) and existing event handlers.
+- Keep the original language, framework idioms, indentation and quoting style. In JSX use className, htmlFor and camelCase event props; in HTML use class and for.
+- Prefer native semantic elements over ARIA. Use ARIA only when no native element fits, and never add a role that duplicates the element's implicit role.
+- Do not invent content the code cannot know. When text is needed (alt text, labels, error messages), write a short, neutral placeholder that makes the gap obvious to a developer.
+- Never remove content, comments or unrelated attributes, and do not reformat code you are not changing.
+
+Perceivable (category "perceivable"), focused on visual content, color contrast and text alternatives:
+- 1.1.1 Non-text Content: give <img>, <input type="image">, <area> and <svg> a text alternative through alt, aria-label, aria-labelledby or <title>. Mark purely decorative images with alt="" instead.
+- 1.2.x Time-based Media: add <track kind="captions"> to <video>, and point to a transcript for <audio>.
+- 1.3.1 Info and Relationships: express visual structure in markup with headings, lists, <th> plus scope in tables, and fieldset/legend for grouped controls.
+- 1.4.1 Use of Color / 1.4.3 Contrast: do not rely on color alone. Pair foreground colors with an explicit background, and prefer values that reach 4.5:1 (3:1 for large text). When the right color cannot be determined, add a comment asking for manual contrast review.
+- 1.4.4 Resize Text: prefer relative units (rem, em, %) over fixed pixel font sizes.
+
+Operable (category "operable"), focused on keyboard navigation, focus management and motor accessibility:
+- 2.1.1 Keyboard: interactive behaviour must work from the keyboard. Replace clickable <div>/<span> elements with <button> where possible; otherwise add tabIndex={0} (tabindex="0" in HTML), an appropriate role and a key handler that activates on Enter and Space.
+- 2.4.3 Focus Order / 2.4.7 Focus Visible: remove positive tabindex values, and replace outline: none with a visible :focus-visible style.
+- 2.4.4 Link Purpose: give links discernible text; replace generic text such as "click here" or add an aria-label that describes the destination.
+- Form inputs need an associated <label>, aria-label or aria-labelledby. Prefer a visible <label> tied to the input's id.
+
+Understandable (category "understandable"), focused on clear instructions, error handling and cognitive accessibility:
+- 3.1.1 Language of Page / 3.1.2 Language of Parts: add a valid lang attribute to <html>, and to passages in another language.
+- 3.2.1 On Focus / 3.2.2 On Input: do not change context on focus or input; move auto-submit behaviour behind an explicit control.
+- 3.3.1 Error Identification: describe errors in text and associate them with the field using aria-invalid and aria-describedby.
+- 3.3.2 Labels or Instructions: give inputs that expect a specific format visible instructions linked with aria-describedby.
+- Heading levels must not skip; adjust the level rather than the visual style.
+
+Robust (category "robust"), focused on ARIA roles, semantic HTML and assistive technology compatibility:
+- 4.1.1 Parsing: make id attributes unique and close malformed or unclosed markup.
+- 4.1.2 Name, Role, Value: custom widgets need a role, an accessible name and the right state attributes (aria-expanded, aria-checked, aria-selected, aria-pressed) kept in sync with the UI state.
+- 4.1.3 Status Messages: announce dynamic updates with role="status", role="alert" or aria-live.
+- Remove ARIA attributes that are invalid for the element's role, and replace generic containers with <button>, <nav>, <header>, <main> or <footer> when they act as those elements.
+
+Confidence guidelines:
+- 0.8-1.0: the fix fully resolves the issue without needing information you do not have.
+- 0.5-0.7: the fix resolves the issue but relies on placeholder text or assumptions about surrounding code.
+- Below 0.5: the fix is a partial mitigation or mainly flags the code for manual review.
+
+Response format:
+Respond with a single JSON object and nothing else, using this structure:
+{
+    "fixes": [
+        {
+            "issue_index": issue_index,
+            "before_code": "the original snippet, copied verbatim",
+            "after_code": "the repaired snippet",
+            "confidence": 0.0-1.0,
+            "explanation": "one or two sentences describing the fix"
+        }
+    ]
+}
+
+Rules:
+- Include one entry in "fixes" for every issue_index you received.
+- "before_code" must equal the issue's "code", character for character.
+- "after_code" must be a drop-in replacement for "before_code" and must not include surrounding code you were not given.
+- "confidence" is a number, not a string.
+- If the snippet does not actually exhibit the issue, return it unchanged in both fields with confidence 0."""
+
+
+# Structured output schema for fix responses, enforced by the API so replies always parse
+FIX_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "fixes",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "fixes": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "issue_index": {"type": "integer"},
+                            "before_code": {"type": "string"},
+                            "after_code": {"type": "string"},
+                            "confidence": {"type": "number"},
+                            "explanation": {"type": "string"}
+                        },
+                        "required": ["issue_index", "before_code", "after_code", "confidence", "explanation"],
+                        "additionalProperties": False
+                    }
+                }
+            },
+            "required": ["fixes"],
+            "additionalProperties": False
+        }
+    }
+}
+
+
+# Lines of context kept after the flagged lines of a long snippet, and the cap on what
+# is sent per issue; fewer input tokens means faster prefill and cheaper requests
+SNIPPET_CONTEXT_LINES = 3
+MAX_SNIPPET_CHARS = 4000
+
+
+def trim_snippet(issue: Issue) -> Tuple[str, str]:
+    """Split an issue's snippet into the part sent to the LLM and the elided tail"""
+    # Snippets start at (or up to SNIPPET_CONTEXT_LINES before) line_start, so only
+    # the tail past the flagged lines plus context can be dropped
+    lines = issue.code_snippet.split("\n")
+    keep = max(1, issue.line_end - issue.line_start + 1) + 2 * SNIPPET_CONTEXT_LINES
+    snippet = "\n".join(lines[:keep])
+    while len(snippet) >= MAX_SNIPPET_CHARS and "\n" in snippet:
+        snippet = snippet.rsplit("\n", 1)[0]
+    return snippet, issue.code_snippet[len(snippet):]
+
+
+def _language(file_path: str) -> str:
+    """File extension telling the LLM which language a snippet is in"""
+    return os.path.splitext(file_path)[1].lower()
+
+
+def fix_messages(category: str, issues: List[Issue]) -> List[Dict[str, str]]:
+    """Build the chat messages asking the LLM to fix a batch of issues, static prefix first"""
+    batch = {
+        "category": category,
+        "issues": [
+            {
+                "issue_index": index,
+                "rule_id": issue.rule_id,
+                "description": issue.description,
+                "language": _language(issue.file_path),
+                "lines": f"{issue.line_start}-{issue.line_end}",
+                "code": trim_snippet(issue)[0]
+            }
+            for index, issue in enumerate(issues)
+        ]
+    }
+    return [
+        {"role": "system", "content": FIX_SYSTEM_PROMPT},
+        {"role": "user", "content": orjson.dumps(batch).decode("utf-8")}
+    ]
+
+
+def fix_cache_key(category: str, model: str, issue: Issue) -> str:
+    """Key a fix by everything that shapes the LLM's answer except per-issue location"""
+    return LLMCache.make_key(
+        FIX_SYSTEM_PROMPT, model, category, issue.rule_id,
+        _language(issue.file_path), trim_snippet(issue)[0]
+    )
+
+
+def _fixes_by_index(fix_data: Optional[Dict[str, Any]], count: int) -> Dict[int, Dict[str, Any]]:
+    """Map well-formed entries of an LLM fix response to the issue_index they answer"""
+    fixes = {}
+    entries = fix_data.get("fixes") if isinstance(fix_data, dict) else None
+    for entry in entries if isinstance(entries, list) else []:
+        if not isinstance(entry, dict):
+            continue
+        index = entry.get("issue_index")
+        if (
+            isinstance(index, int) and 0 <= index < count
+            and isinstance(entry.get("before_code"), str)
+            and isinstance(entry.get("after_code"), str)
+            and isinstance(entry.get("confidence"), (int, float))
+        ):
+            fixes[index] = entry
+    return fixes
+
+
+def is_no_op_fix(fix: Dict[str, Any]) -> bool:
+    """Whether the LLM answered that the snippet does not exhibit the issue, leaving it unchanged"""
+    return fix["after_code"] == fix["before_code"] or fix["confidence"] <= 0
+
+
+async def request_fixes(
+    client,
+    model: str,
+    category: str,
+    issues: List[Issue],
+    batch_size: int,
+    sem: asyncio.Semaphore,
+    fast_model: Optional[str] = None,
+    escalate_below: float = 0.6
+) -> List[Optional[Dict[str, Any]]]:
+    """Fix data for each issue, in order, serving cached fixes and sending the rest to the LLM in batches"""
+    # Issue ids are not unique (LLM-assigned ones repeat across files), so fixes are
+    # matched to issues by position
+    fixes: List[Optional[Dict[str, Any]]] = [None] * len(issues)
+    sendable = [index for index, issue in enumerate(issues) if len(trim_snippet(issue)[0]) < MAX_SNIPPET_CHARS]
+    if len(sendable) < len(issues):
+        print(f"Skipping LLM fixes for {len(issues) - len(sendable)} {category} issues with snippets over {MAX_SNIPPET_CHARS} chars")
+    
+    # Fixes produced with a fast model in front are cached apart from single-model ones
+    cache_model = f"{fast_model}|{model}" if fast_model else model
+    keys = [fix_cache_key(category, cache_model, issues[index]) for index in sendable]
+    cached = await asyncio.gather(*[fix_cache.get(key) for key in keys])
+    
+    # Issues with the same snippet and rule share one LLM answer
+    pending: Dict[str, List[int]] = {}
+    for index, key, fix_data in zip(sendable, keys, cached):
+        if fix_data is not None:
+            fixes[index] = _stitch(issues[index], fix_data)
+        else:
+            pending.setdefault(key, []).append(index)
+    
+    groups = [(key, [issues[index] for index in indices]) for key, indices in pending.items()]
+    answers = await _request_fix_batches(client, fast_model or model, category, groups, batch_size, sem)
+    # Answers from the main model; a fast model's answer is only final once it is confident
+    strong = set(answers) if not fast_model else set()
+    if fast_model:
+        # Escalate whatever the fast model could not fix confidently to the main model;
+        # snippets it found not to exhibit the issue are not paid for twice
+        escalate = [
+            (key, group) for key, group in groups
+            if key not in answers
+            or (answers[key]["confidence"] < escalate_below and not is_no_op_fix(answers[key]))
+        ]
+        if escalate:
+            escalated = await _request_fix_batches(client, model, category, escalate, batch_size, sem)
+            answers.update(escalated)
+            strong.update(escalated)
+    
+    for key, indices in pending.items():
+        fix = answers.get(key)
+        if fix is None:
+            continue
+        # A low-confidence fast answer left over from a failed escalation is used but not
+        # cached, so later runs try the main model again
+        if key in strong or fix["confidence"] >= escalate_below:
+            await fix_cache.set(key, fix)
+        for index in indices:
+            fixes[index] = _stitch(issues[index], fix)
+    return fixes
+
+
+def _stitch(issue: Issue, fix: Dict[str, Any]) -> Dict[str, Any]:
+    """Re-attach the snippet tail elided from the prompt to a fix of the trimmed snippet"""
+    snippet, tail = trim_snippet(issue)
+    if not tail or fix["before_code"] != snippet:
+        return fix
+    return {**fix, "before_code": issue.code_snippet, "after_code": fix["after_code"] + tail}
+
+
+async def _request_fix_batches(
+    client,
+    model: str,
+    category: str,
+    groups: List[Tuple[str, List[Issue]]],
+    batch_size: int,
+    sem: asyncio.Semaphore
+) -> Dict[str, Dict[str, Any]]:
+    """Send groups to the LLM batch_size at a time, returning fix data by cache key"""
+    batches = await asyncio.gather(*[
+        _request_fix_batch(client, model, category, groups[i:i + batch_size], sem)
+        for i in range(0, len(groups), batch_size)
+    ])
+    answers = {}
+    for batch in batches:
+        answers.update(batch)
+    return answers
+
+
+async def _request_fix_batch(
+    client,
+    model: str,
+    category: str,
+    groups: List[Tuple[str, List[Issue]]],
+    sem: asyncio.Semaphore
+) -> Dict[str, Dict[str, Any]]:
+    """Ask the LLM to fix one batch of issues in a single request, returning fix data by cache key"""
+    request = {
+        "model": model,
+        "messages": fix_messages(category, [group[0] for _, group in groups]),
+        "temperature": 0.1,
+        # Route requests for this category to the same prompt cache
+        "extra_body": {"prompt_cache_key": category},
+        "response_format": FIX_RESPONSE_FORMAT
+    }
+    
+    try:
+        async with sem:
+            response = await client.chat.completions.create(**request)
+        fix_data = orjson.loads(response.choices[0].message.content)
+    except Exception as e:
+        print(f"LLM fix failed for {len(groups)} {category} issues with {model}: {e}")
+        return {}
+    
+    return {
+        groups[index][0]: fix
+        for index, fix in _fixes_by_index(fix_data, len(groups)).items()
+    }
@@ -0,0 +1,146 @@
+import os
+import time
+import uuid
+import hashlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+import aiofiles
+import orjson
+from utils.path_utils import get_data_dir
+
+# Temp files this old were left by a writer that died before renaming them
+STALE_TMP_SECONDS = 3600
+
+
+def _remove(path: Path) -> None:
+    """Delete a cache file, ignoring one already removed by another process"""
+    try:
+        path.unlink()
+    except OSError:
+        pass
+
+
+def prune_llm_cache(max_bytes: int) -> int:
+    """Delete expired entries of every LLMCache namespace, then the oldest ones beyond max_bytes"""
+    removed = 0
+    now = time.time()
+    live = []
+    for path in (get_data_dir() / "cache").glob("*/*"):
+        try:
+            stat = path.stat()
+            if path.suffix == ".tmp":
+                if stat.st_mtime < now - STALE_TMP_SECONDS:
+                    _remove(path)
+                    removed += 1
+                continue
+            expires_at = orjson.loads(path.read_bytes()).get("expires_at", 0)
+        except (OSError, ValueError):
+            continue
+        if expires_at < now:
+            _remove(path)
+            removed += 1
+        else:
+            live.append((stat.st_mtime, stat.st_size, path))
+
+    # Over the cap, the least recently written entries go first
+    total = sum(size for _, size, _ in live)
+    for _, size, path in sorted(live):
+        if total <= max_bytes:
+            break
+        _remove(path)
+        total -= size
+        removed += 1
+    return removed
+
+
+class LLMCache:
+    """Disk-backed cache for parsed LLM responses, keyed by a content hash"""
+
+    def __init__(self, namespace: str, ttl: int = 7 * 86400):
+        self.cache_dir = get_data_dir() / "cache" / namespace
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.stats = {"hits": 0, "misses": 0}
+
+    @staticmethod
+    def make_key(*parts: str) -> str:
+        """Hash the request inputs into a cache key"""
+        return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss or expired entry"""
+        path = self.cache_dir / f"{key}.json"
+        try:
+            async with aiofiles.open(path, 'rb') as f:
+                entry = orjson.loads(await f.read())
+        except (OSError, ValueError):
+            self.stats["misses"] += 1
+            return None
+
+        if entry.get("expires_at", 0) < time.time():
+            self.stats["misses"] += 1
+            _remove(path)
+            return None
+
+        self.stats["hits"] += 1
+        return entry["value"]
+
+    async def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serializable value under key"""
+        path = self.cache_dir / f"{key}.json"
+        # Write to a unique temp file and rename so readers never see partial entries
+        tmp_path = self.cache_dir / f"{key}.{uuid.uuid4().hex}.tmp"
+        try:
+            async with aiofiles.open(tmp_path, 'wb') as f:
+                await f.write(orjson.dumps({"expires_at": time.time() + self.ttl, "value": value}, default=str))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Failed to write LLM cache entry {key}: {e}")
+
+
+class MemoryLRUCache:
+    """Process-wide in-memory LRU for parsed LLM responses, optionally backed by an LLMCache"""
+
+    def __init__(self, maxsize: int = 1024, backing: Optional[LLMCache] = None):
+        self.maxsize = maxsize
+        self.backing = backing
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0}
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for key, falling back to the backing cache on a miss"""
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.stats["misses"] += 1
+            if self.backing is None:
+                return None
+            value = await self.backing.get(key)
+            if value is not None:
+                self._remember(key, value)
+            return value
+        self._entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return value
+
+    async def set(self, key: str, value: Any) -> None:
+        """Store value under key in memory and in the backing cache"""
+        self._remember(key, value)
+        if self.backing is not None:
+            await self.backing.set(key, value)
+
+    def _remember(self, key: str, value: Any) -> None:
+        """Keep value in memory, evicting the least recently used entry when full"""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+# Shared by all POUR agents so repeated snippets across a codebase are only fixed once;
+# the disk tier carries fixes over between jobs and server restarts
+fix_cache = MemoryLRUCache(
+    int(os.getenv("POUR_FIX_CACHE_SIZE", "1024")),
+    LLMCache("fixes") if os.getenv("POUR_FIX_DISK_CACHE", "true").lower() == "true" else None
+)
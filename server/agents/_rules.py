@@ -0,0 +1,69 @@
+import re
+from collections import Counter
+from typing import List, Optional, Tuple
+from models.job import Issue, Fix
+from agents._diff import create_diff
+
+# Deterministic fixes tried before the LLM for issues without a dedicated rule fixer:
+# (name, keywords, pattern, replacement, confidence). A pattern only applies when the
+# issue's rule or description mentions one of its keywords, so a snippet that merely
+# contains the pattern is not rewritten for an unrelated issue.
+_CLICKABLE_KEYWORDS = ("keyboard", "click", "role", "2.1.1", "4.1.2")
+PATTERNS: List[Tuple[str, Tuple[str, ...], "re.Pattern[str]", str, float]] = [
+    (
+        "img-alt",
+        ("alt", "image", "img", "1.1.1", "text alternative"),
+        re.compile(r'<img\b(?![^>]*\balt\s*=)'),
+        '<img alt="Descriptive text for image"',
+        0.6
+    ),
+    (
+        "html-lang",
+        ("lang", "3.1.1"),
+        re.compile(r'<html\b(?![^>]*\blang\s*=)'),
+        '<html lang="en"',
+        0.8
+    ),
+    (
+        "jsx-clickable",
+        _CLICKABLE_KEYWORDS,
+        re.compile(r'<(div|span)\b(?=[^>]*\bonClick=)(?![^>]*\brole\s*=)'),
+        r'<\1 role="button" tabIndex={0}',
+        0.5
+    ),
+    (
+        "html-clickable",
+        _CLICKABLE_KEYWORDS,
+        re.compile(r'<(div|span)\b(?=[^>]*\bonclick=)(?![^>]*\brole\s*=)'),
+        r'<\1 role="button" tabindex="0"',
+        0.5
+    ),
+]
+
+# Hits per pattern, plus "llm" for issues no pattern could fix, for tuning the table
+pattern_stats: Counter = Counter()
+
+
+def pattern_fix(issue: Issue) -> Optional[Fix]:
+    """Fix an issue with the first deterministic pattern that applies, or None to use the LLM"""
+    text = f"{issue.rule_id or ''} {issue.description}".lower()
+    code = issue.code_snippet
+    for name, keywords, pattern, replacement, confidence in PATTERNS:
+        if not any(keyword in text for keyword in keywords):
+            continue
+        new_code, count = pattern.subn(replacement, code)
+        if count and new_code != code:
+            pattern_stats[name] += 1
+            return Fix(
+                issue_id=issue.id,
+                file_path=issue.file_path,
+                before_code=code,
+                after_code=new_code,
+                diff=create_diff(code, new_code),
+                confidence=confidence,
+                applied=True,
+                line_start=issue.line_start,
+                line_end=issue.line_end
+            )
+    pattern_stats["llm"] += 1
+    return None
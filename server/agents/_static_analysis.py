@@ -0,0 +1,259 @@
+import re
+import bisect
+from pathlib import Path
+from typing import List
+from models.job import Issue
+
+try:
+    import lxml.html
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# Precompiled patterns for static analysis. All are ASCII, so files are
+# scanned as raw bytes and only the reported snippets are decoded.
+# Whole-file scans use RE2's linear-time automaton when it is installed;
+# the attribute checks need lookbehind, which RE2 lacks, but only ever
+# run on a single tag.
+_scan_re = re2 if RE2_AVAILABLE else re
+_ALT_ATTR = re.compile(rb'(?<![\w-])alt\s*=')
+_LABEL_ATTR = re.compile(rb'(?<![\w-])aria-label(?:ledby)?\s*=')
+# Groups are read by position: RE2 reports bytes group names for bytes patterns
+_HTML_COMBINED = _scan_re.compile(rb'(<img\b[^>]*)|(<input\b[^>]*)|<h([1-6])\b')
+_NEWLINE = re.compile(rb'\n')
+_ONCLICK = _scan_re.compile(rb'<[^>\n]*onClick')
+_COLOR_DECL = re.compile(rb'color:')
+
+
+def _line_starts(content: bytes) -> List[int]:
+    """Offsets at which each line of content starts"""
+    return [0] + [m.end() for m in _NEWLINE.finditer(content)]
+
+
+def _line_at(content: bytes, line_starts: List[int], line_num: int) -> bytes:
+    """Slice a 1-based line out of content without splitting the whole file"""
+    end = line_starts[line_num] - 1 if line_num < len(line_starts) else len(content)
+    return content[line_starts[line_num - 1]:end]
+
+
+def _snippet(line: bytes) -> str:
+    """Decode a source line for use as an issue's code snippet"""
+    return line.strip().decode('utf-8', errors='replace')
+
+
+def _analyze_html(file_path: Path, content: bytes) -> List[Issue]:
+    """Analyze HTML files by walking the parsed document, falling back to regex scanning"""
+    if not LXML_AVAILABLE or not content.strip():
+        return _analyze_html_jsx(file_path, content)
+
+    try:
+        tree = lxml.html.document_fromstring(content)
+    except Exception as e:
+        print(f"HTML parsing failed for {file_path}, using regex analysis: {e}")
+        return _analyze_html_jsx(file_path, content)
+
+    issues = []
+    line_starts = _line_starts(content)
+    labelled_ids = {label.get('for') for label in tree.iter('label') if label.get('for')}
+
+    # Check for missing alt attributes
+    for node in tree.iter('img'):
+        if node.get('alt') is None and node.sourceline:
+            line_num = node.sourceline
+            issues.append(Issue(
+                id=f"{file_path.name}_{line_num}_missing_alt",
+                file_path=str(file_path),
+                line_start=line_num,
+                line_end=line_num,
+                category="perceivable",
+                severity="high",
+                description="Image missing alt attribute",
+                code_snippet=_snippet(_line_at(content, line_starts, line_num)),
+                rule_id="img-alt"
+            ))
+
+    # Check for missing form labels
+    for node in tree.iter('input'):
+        if not node.sourceline or node.get('aria-label') is not None or node.get('aria-labelledby') is not None:
+            continue
+        if node.get('id') in labelled_ids or any(parent.tag == 'label' for parent in node.iterancestors()):
+            continue
+        line_num = node.sourceline
+        issues.append(Issue(
+            id=f"{file_path.name}_{line_num}_missing_label",
+            file_path=str(file_path),
+            line_start=line_num,
+            line_end=line_num,
+            category="operable",
+            severity="high",
+            description="Input missing label or aria-label",
+            code_snippet=_snippet(_line_at(content, line_starts, line_num)),
+            rule_id="label"
+        ))
+
+    # Check for missing heading hierarchy
+    prev_level = None
+    for node in tree.iter('h1', 'h2', 'h3', 'h4', 'h5', 'h6'):
+        if not node.sourceline:
+            continue
+        line_num, level = node.sourceline, int(node.tag[1])
+        if prev_level is not None and level > prev_level + 1:
+            issues.append(Issue(
+                id=f"{file_path.name}_{line_num}_heading_skip",
+                file_path=str(file_path),
+                line_start=line_num,
+                line_end=line_num,
+                category="understandable",
+                severity="medium",
+                description="Heading level skipped",
+                code_snippet=_snippet(_line_at(content, line_starts, line_num)),
+                rule_id="heading-order"
+            ))
+        prev_level = level
+
+    return issues
+
+
+def _analyze_html_jsx(file_path: Path, content: bytes) -> List[Issue]:
+    """Analyze HTML/JSX files for accessibility issues in a single pass over the content"""
+    issues = []
+    line_starts = _line_starts(content)
+
+    prev_level = None
+    for match in _HTML_COMBINED.finditer(content):
+        line_num = bisect.bisect_right(line_starts, match.start())
+        img_tag, input_tag, heading_level = match.group(1, 2, 3)
+
+        # Check for missing alt attributes
+        if img_tag is not None:
+            if not _ALT_ATTR.search(img_tag):
+                issues.append(Issue(
+                    id=f"{file_path.name}_{line_num}_missing_alt",
+                    file_path=str(file_path),
+                    line_start=line_num,
+                    line_end=line_num,
+                    category="perceivable",
+                    severity="high",
+                    description="Image missing alt attribute",
+                    code_snippet=_snippet(_line_at(content, line_starts, line_num)),
+                    rule_id="img-alt"
+                ))
+
+        # Check for missing form labels
+        elif input_tag is not None:
+            line = _line_at(content, line_starts, line_num)
+            if b'<label' not in line and not _LABEL_ATTR.search(input_tag):
+                issues.append(Issue(
+                    id=f"{file_path.name}_{line_num}_missing_label",
+                    file_path=str(file_path),
+                    line_start=line_num,
+                    line_end=line_num,
+                    category="operable",
+                    severity="high",
+                    description="Input missing label or aria-label",
+                    code_snippet=_snippet(line),
+                    rule_id="label"
+                ))
+
+        # Check for missing heading hierarchy
+        else:
+            level = int(heading_level)
+            if prev_level is not None and level > prev_level + 1:
+                issues.append(Issue(
+                    id=f"{file_path.name}_{line_num}_heading_skip",
+                    file_path=str(file_path),
+                    line_start=line_num,
+                    line_end=line_num,
+                    category="understandable",
+                    severity="medium",
+                    description="Heading level skipped",
+                    code_snippet=_snippet(_line_at(content, line_starts, line_num)),
+                    rule_id="heading-order"
+                ))
+            prev_level = level
+
+    return issues
+
+
+def _analyze_js_ts(file_path: Path, content: bytes) -> List[Issue]:
+    """Analyze JS/TS files for accessibility issues"""
+    issues = []
+    line_starts = _line_starts(content)
+    flagged_lines = set()
+
+    # Check for missing ARIA attributes in event handlers
+    for match in _ONCLICK.finditer(content):
+        line_num = bisect.bisect_right(line_starts, match.start())
+        if line_num in flagged_lines:
+            continue
+        line = _line_at(content, line_starts, line_num)
+        if b'aria-label' not in line:
+            flagged_lines.add(line_num)
+            issues.append(Issue(
+                id=f"{file_path.name}_{line_num}_missing_aria",
+                file_path=str(file_path),
+                line_start=line_num,
+                line_end=line_num,
+                category="operable",
+                severity="medium",
+                description="Interactive element missing ARIA label",
+                code_snippet=_snippet(line),
+                rule_id="aria-label"
+            ))
+
+    return issues
+
+
+def _analyze_css(file_path: Path, content: bytes) -> List[Issue]:
+    """Analyze CSS files for accessibility issues"""
+    issues = []
+    line_starts = _line_starts(content)
+    flagged_lines = set()
+
+    # Check for color contrast issues (simplified)
+    for match in _COLOR_DECL.finditer(content):
+        line_num = bisect.bisect_right(line_starts, match.start())
+        if line_num in flagged_lines:
+            continue
+        line = _line_at(content, line_starts, line_num)
+        if b'background' not in line.lower():
+            # This is a simplified check - in production, use proper color contrast analysis
+            flagged_lines.add(line_num)
+            issues.append(Issue(
+                id=f"{file_path.name}_{line_num}_color_contrast",
+                file_path=str(file_path),
+                line_start=line_num,
+                line_end=line_num,
+                category="perceivable",
+                severity="medium",
+                description="Potential color contrast issue - verify with tools",
+                code_snippet=_snippet(line),
+                rule_id="color-contrast"
+            ))
+
+    return issues
+
+
+# Static analyzer for each supported file extension
+_ANALYZERS = {
+    ext: analyzer
+    for exts, analyzer in [
+        (('.html',), _analyze_html),
+        (('.jsx', '.tsx'), _analyze_html_jsx),
+        (('.js', '.ts'), _analyze_js_ts),
+        (('.css',), _analyze_css)
+    ]
+    for ext in exts
+}
+
+
+def analyze_content(file_path: Path, content: bytes) -> List[Issue]:
+    """Run the static analyzers for a file's type; module-level so it can run in a process pool"""
+    analyzer = _ANALYZERS.get(file_path.suffix)
+    return analyzer(file_path, content) if analyzer else []
@@ -1,50 +1,491 @@
 import os
-import re
-import json
+import asyncio
+import hashlib
 import subprocess
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Tuple, Optional, Callable, Awaitable, AsyncIterator, Set
+import httpx
 import openai
-import aiofiles
+import orjson
+from pydantic import ValidationError
+from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 from models.job import Issue, Fix
+from agents._llm_cache import LLMCache
+from agents._rules import pattern_stats
+from agents._static_analysis import analyze_content
+
+try:
+    import tiktoken
+    TIKTOKEN_AVAILABLE = True
+except ImportError:
+    TIKTOKEN_AVAILABLE = False
+
+POUR_CATEGORIES = ("perceivable", "operable", "understandable", "robust")
+SEVERITY_WEIGHTS = {"high": 3, "medium": 2, "low": 1}
+
+# OpenAI errors worth retrying: rate limits, 5xx responses and dropped connections
+_RETRYABLE_ERRORS = (openai.RateLimitError, openai.InternalServerError, openai.APIConnectionError)
+
+# Characters of each file sent to the LLM when tiktoken is unavailable
+LLM_CONTENT_CHARS = 2000
+# Upper bound on the bytes a single token covers, used to avoid tokenizing whole files
+_MAX_TOKEN_BYTES = 16
+
+# Static instructions for LLM analysis. Kept free of interpolation and sent
+# first so the prefix is identical on every request and eligible for
+# OpenAI's automatic prompt caching (which requires a prefix >1024 tokens).
+SYSTEM_PROMPT = """You are an accessibility expert. Analyze source code for WCAG 2.1 compliance issues.
+
+You will receive a JSON array of files. Each entry has:
+- "file_id": integer identifying the file within this request
+- "suffix": the file extension (.html, .jsx, .tsx, .js, .ts or .css)
+- "content": the beginning of the file's source code
+
+Review every file against the four POUR principles of WCAG 2.1 and report concrete, line-specific issues.
+
+Perceivable (category "perceivable"):
+- 1.1.1 Non-text Content: <img>, <input type="image">, <area>, <svg> and <canvas> need a text alternative (alt, aria-label, aria-labelledby or <title>). Decorative images should use alt="".
+- 1.2.x Time-based Media: <video> and <audio> need captions, transcripts or audio descriptions where applicable.
+- 1.3.1 Info and Relationships: structure conveyed visually must be available programmatically (headings, lists, tables with <th>/scope, fieldset/legend for grouped controls).
+- 1.3.5 Identify Input Purpose: personal-data inputs should carry an appropriate autocomplete attribute.
+- 1.4.1 Use of Color: color must not be the only means of conveying information.
+- 1.4.3 Contrast (Minimum): text needs a contrast ratio of at least 4.5:1 (3:1 for large text). Flag foreground colors declared without a matching background.
+- 1.4.4 Resize Text / 1.4.10 Reflow: avoid fixed pixel font sizes and fixed-width containers that break at 320 CSS pixels.
+- 1.4.11 Non-text Contrast: focus indicators and control boundaries need 3:1 contrast.
+- 1.4.12 Text Spacing / 1.4.13 Content on Hover or Focus: hover/focus content must be dismissible, hoverable and persistent.
+
+Operable (category "operable"):
+- 2.1.1 Keyboard: every interactive element must be reachable and usable with a keyboard. Flag onClick handlers on non-interactive elements (<div>, <span>) without tabIndex and key handlers.
+- 2.1.2 No Keyboard Trap: focus must be able to leave every component.
+- 2.2.1 Timing Adjustable / 2.2.2 Pause, Stop, Hide: auto-advancing or moving content needs user controls.
+- 2.3.1 Three Flashes: avoid content that flashes more than three times per second.
+- 2.4.1 Bypass Blocks: pages need a skip link or landmarks.
+- 2.4.2 Page Titled: documents need a descriptive <title>.
+- 2.4.3 Focus Order / 2.4.7 Focus Visible: avoid positive tabindex values and outline: none without a replacement focus style.
+- 2.4.4 Link Purpose: links need discernible text; flag empty links and generic text such as "click here".
+- 2.5.3 Label in Name: the accessible name must contain the visible label.
+- Form inputs need an associated <label>, aria-label or aria-labelledby.
+
+Understandable (category "understandable"):
+- 3.1.1 Language of Page: <html> needs a valid lang attribute.
+- 3.1.2 Language of Parts: content in another language needs its own lang attribute.
+- 3.2.1 On Focus / 3.2.2 On Input: focus or input changes must not trigger unexpected context changes (e.g. auto-submitting forms on change).
+- 3.3.1 Error Identification: errors must be described in text and associated with the field (aria-invalid, aria-describedby).
+- 3.3.2 Labels or Instructions: inputs that require a format need visible instructions.
+- Heading levels must not skip (e.g. <h1> followed by <h3>).
+
+Robust (category "robust"):
+- 4.1.1 Parsing: flag duplicate id attributes and malformed or unclosed markup.
+- 4.1.2 Name, Role, Value: custom widgets need an appropriate role, accessible name and state attributes (aria-expanded, aria-checked, aria-selected, aria-pressed).
+- 4.1.3 Status Messages: dynamic status updates need role="status", role="alert" or aria-live.
+- ARIA attributes must be valid for the element's role, and ARIA should not override native semantics unnecessarily; prefer semantic HTML (<button>, <nav>, <header>, <main>) over generic containers.
+
+Severity guidelines:
+- "high": blocks access for some users (missing text alternatives, unlabeled controls, keyboard-inaccessible actions).
+- "medium": significantly degrades the experience (contrast concerns, heading skips, missing landmarks).
+- "low": best-practice deviations with limited user impact.
+
+Response format:
+Respond with a single JSON object and nothing else, using this structure:
+{
+    "results": [
+        {
+            "file_id": file_id,
+            "issues": [
+                {
+                    "id": "unique_id",
+                    "line_start": line_number,
+                    "line_end": line_number,
+                    "category": "perceivable|operable|understandable|robust",
+                    "severity": "high|medium|low",
+                    "description": "Issue description",
+                    "code_snippet": "relevant code",
+                    "rule_id": "wcag_rule_id"
+                }
+            ]
+        }
+    ]
+}
+
+Rules:
+- Include one entry in "results" for every file_id you received, with an empty "issues" array when a file has no issues.
+- Line numbers are 1-based and refer to the content you received.
+- "code_snippet" must be copied verbatim from the file content.
+- Make every "id" unique within the response.
+- Only report issues you can point to in the code; do not speculate about files you were not given."""
+
+
+@dataclass
+class SummaryStats:
+    """Issue statistics for the job report"""
+    issues_by_category: Dict[str, int] = field(default_factory=dict)
+    issues_by_severity: Dict[str, int] = field(default_factory=dict)
+    file_types: Dict[str, int] = field(default_factory=dict)
+    files_processed: int = 0
+    complexity_score: float = 0.0
+
+
+def _read_head(file_path: Path, limit: int) -> Tuple[int, bytes]:
+    """Return a file's size and its first limit bytes without reading the rest"""
+    with open(file_path, 'rb') as f:
+        return os.fstat(f.fileno()).st_size, f.read(limit)
+
 
 class BrainAgent:
     def __init__(self):
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key or api_key == "your_openai_api_key_here":
             raise ValueError("OPENAI_API_KEY environment variable must be set to a valid API key")
-        self.client = openai.OpenAI(api_key=api_key)
+        # Shared HTTP/2 connection pool so concurrent requests reuse connections
+        self._http = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(60.0, connect=5.0),
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32)
+        )
+        # Retries are handled by tenacity in _create_completion
+        self.client = openai.AsyncOpenAI(api_key=api_key, http_client=self._http, max_retries=0)
         self.model = os.getenv("OPENAI_MODEL", "gpt-5.1")
+        # Bound concurrent per-file analysis to respect OpenAI rate limits
+        self._sem = asyncio.Semaphore(int(os.getenv("BRAIN_CONCURRENCY", "8")))
+        # Number of files sent to the LLM in a single request
+        self.llm_batch_size = int(os.getenv("BRAIN_LLM_BATCH_SIZE", "5"))
+        # Estimated file-content tokens per LLM request; a single larger file still gets its own request
+        self.llm_batch_tokens = int(os.getenv("BRAIN_LLM_BATCH_TOKENS", "8000"))
+        # Route LLM analysis through the OpenAI Batch API (cheaper, up to 24h turnaround)
+        self.use_batch_api = os.getenv("BRAIN_USE_BATCH_API", "false").lower() == "true"
+        # Token budget per file sent to the LLM
+        self.llm_max_tokens = int(os.getenv("BRAIN_MAX_TOKENS", "6000"))
+        self._encoding = self._load_encoding()
+        # Bytes of each file's head that _llm_text can use; the rest is never kept for the LLM
+        self.llm_prefix_bytes = (
+            LLM_CONTENT_CHARS * 4 if self._encoding is None else self.llm_max_tokens * _MAX_TOKEN_BYTES
+        )
+        # Files that are very large or already have many static issues skip the real-time LLM pass
+        self.static_issue_cap = int(os.getenv("STATIC_ISSUE_CAP", "50"))
+        self.max_llm_bytes = int(os.getenv("MAX_LLM_BYTES", "200000"))
+        self.llm_small_file_bytes = int(os.getenv("BRAIN_LLM_SMALL_FILE_BYTES", "500"))
+        # Parsed LLM results for unchanged files are reused across runs
+        self.llm_cache = LLMCache("brain")
+        # Whole analyses are replayed for uploads whose files are all unchanged
+        self.analysis_cache = (
+            LLMCache("analysis") if os.getenv("BRAIN_ANALYSIS_CACHE", "true").lower() == "true" else None
+        )
+        # Failed LLM analysis requests; an analysis that saw one is not cached
+        self.llm_failures = 0
+        # Static analysis worker processes per uvicorn worker; 0 keeps it on threads
+        self.analysis_processes = int(os.getenv("BRAIN_ANALYSIS_PROCESSES", "2"))
+        self._process_pool = None
+        # File suffixes seen per job during analysis, consumed by the report
+        self._job_suffixes: Dict[str, frozenset] = {}
     
-    async def analyze_files(self, job_id: str) -> List[Issue]:
-        """Analyze files and detect accessibility issues using AST analysis"""
+    # Services and agents are created once per BrainAgent on first use. Imports stay
+    # lazy so importing this module does not pull in every service.
+    @cached_property
+    def file_service(self):
         from services.file_service import FileService
+        return FileService()
+    
+    @cached_property
+    def ast_service(self):
         from services.ast_service import ASTService
+        return ASTService()
+    
+    @cached_property
+    def validation_service(self):
+        from services.validation_service import ValidationService
+        return ValidationService()
+    
+    @cached_property
+    def report_service(self):
+        from services.report_service import ReportService
+        return ReportService()
+    
+    @cached_property
+    def performance_service(self):
+        from services.performance_service import PerformanceService
+        return PerformanceService()
+    
+    @cached_property
+    def work_plan_service(self):
+        from services.work_plan_service import WorkPlanService
+        return WorkPlanService()
+    
+    @cached_property
+    def rerouting_service(self):
+        from services.rerouting_service import ReroutingService
+        return ReroutingService()
+    
+    @cached_property
+    def pour_agents(self):
+        from agents.pour_agents import POURAgents
+        return POURAgents()
+    
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections and the analysis and PDF worker processes"""
+        await self._http.aclose()
+        if "pour_agents" in self.__dict__:
+            await self.pour_agents.aclose()
+        if self._process_pool is not None:
+            self._process_pool.shutdown(cancel_futures=True)
+            self._process_pool = None
+        if "report_service" in self.__dict__:
+            self.report_service.close()
+    
+    async def _create_completion(self, request: Dict[str, Any]):
+        """Create a chat completion, retrying rate limits and transient server errors"""
+        async for attempt in AsyncRetrying(
+            retry=retry_if_exception_type(_RETRYABLE_ERRORS),
+            wait=wait_random_exponential(multiplier=1, max=30),
+            stop=stop_after_attempt(5),
+            reraise=True
+        ):
+            with attempt:
+                return await self.client.chat.completions.create(**request)
+    
+    async def _stream_json_completion(self, request: Dict[str, Any]) -> str:
+        """Stream a JSON-mode completion, returning as soon as the top-level object closes"""
+        stream = await self._create_completion({**request, "stream": True})
+        parts = []
+        depth = 0
+        in_string = escaped = False
+        try:
+            async for chunk in stream:
+                if not chunk.choices or not chunk.choices[0].delta.content:
+                    continue
+                delta = chunk.choices[0].delta.content
+                parts.append(delta)
+                
+                # Track brace depth outside of string literals to find the end of the object
+                for i, ch in enumerate(delta):
+                    if in_string:
+                        if escaped:
+                            escaped = False
+                        elif ch == '\\':
+                            escaped = True
+                        elif ch == '"':
+                            in_string = False
+                    elif ch == '"':
+                        in_string = True
+                    elif ch == '{':
+                        depth += 1
+                    elif ch == '}':
+                        depth -= 1
+                        if depth == 0:
+                            parts[-1] = delta[:i + 1]
+                            return "".join(parts)
+                    elif depth == 0 and not ch.isspace():
+                        # Off-spec output; stop paying for tokens we cannot use
+                        raise ValueError(f"LLM response is not a JSON object: {''.join(parts)[:100]!r}")
+        finally:
+            await stream.close()
         
-        file_service = FileService()
-        ast_service = ASTService()
+        return "".join(parts)
+    
+    def _load_encoding(self):
+        """Load the tokenizer for the configured model, or None to truncate by characters"""
+        if not TIKTOKEN_AVAILABLE:
+            return None
+        try:
+            try:
+                return tiktoken.encoding_for_model(self.model)
+            except KeyError:
+                # Models tiktoken doesn't know yet use the newest encoding
+                return tiktoken.get_encoding("o200k_base")
+        except Exception as e:
+            print(f"Failed to load tokenizer for {self.model}: {e}")
+            return None
+    
+    def _llm_text(self, content: bytes) -> str:
+        """Decode and trim the prefix of content that is sent to the LLM"""
+        if self._encoding is None:
+            # A UTF-8 character is at most 4 bytes, so this prefix always covers LLM_CONTENT_CHARS
+            return content[:self.llm_prefix_bytes].decode('utf-8', errors='replace')[:LLM_CONTENT_CHARS]
+        
+        text = content[:self.llm_prefix_bytes].decode('utf-8', errors='replace')
+        tokens = self._encoding.encode(text, disallowed_special=())
+        if len(tokens) <= self.llm_max_tokens:
+            return text
+        return self._encoding.decode(tokens[:self.llm_max_tokens])
+    
+    async def analyze_files(self, job_id: str, use_batch_api: Optional[bool] = None) -> List[Issue]:
+        """Analyze files and detect accessibility issues using AST analysis"""
+        issues = []
+        async for batch in self.stream_issues(job_id, use_batch_api):
+            issues.extend(batch)
+        return issues
+    
+    async def stream_issues(self, job_id: str, use_batch_api: Optional[bool] = None) -> AsyncIterator[List[Issue]]:
+        """Yield newly detected, deduplicated issues, replaying a previous analysis of identical files at once"""
+        if self.analysis_cache is None:
+            async for batch in self._detect_issues(job_id, use_batch_api):
+                yield batch
+            return
+        
+        original_dir = self.file_service.data_dir / job_id / "original"
+        key = await asyncio.to_thread(self._analysis_key, original_dir, use_batch_api)
+        cached = await self.analysis_cache.get(key)
+        if cached is not None:
+            print(f"Reusing analysis of identical files for job {job_id}")
+            self._job_suffixes[job_id] = frozenset(cached["suffixes"])
+            # Cached issues were validated when first detected, so they skip validation here
+            issues = [
+                Issue.model_construct(**{**issue, "file_path": str(original_dir / issue["file_path"])})
+                for issue in cached["issues"]
+            ]
+            if issues:
+                yield issues
+            return
+        
+        issues = []
+        failures = self.llm_failures
+        async for batch in self._detect_issues(job_id, use_batch_api):
+            issues.extend(batch)
+            yield batch
+        
+        # An analysis missing an LLM answer is not worth replaying
+        if self.llm_failures != failures:
+            return
+        relative_issues = []
+        for issue in issues:
+            path = Path(issue.file_path)
+            if not path.is_relative_to(original_dir):
+                return
+            relative_issues.append({**issue.model_dump(), "file_path": path.relative_to(original_dir).as_posix()})
+        await self.analysis_cache.set(key, {
+            "suffixes": sorted(self._job_suffixes.get(job_id, ())),
+            "issues": relative_issues
+        })
+    
+    def _analysis_key(self, original_dir: Path, use_batch_api: Optional[bool]) -> str:
+        """Hash every uploaded file's relative path and content, plus the settings that shape the analysis"""
+        digest = hashlib.sha256()
+        for path in sorted(p for p in original_dir.rglob("*") if p.is_file()):
+            digest.update(path.relative_to(original_dir).as_posix().encode("utf-8"))
+            digest.update(hashlib.sha256(path.read_bytes()).digest())
+        batch_api = self.use_batch_api if use_batch_api is None else use_batch_api
+        # Settings deciding which files reach the LLM, and how much of each, change the result
+        settings = (
+            batch_api, self.static_issue_cap, self.max_llm_bytes, self.llm_small_file_bytes, self.llm_prefix_bytes
+        )
+        return LLMCache.make_key(SYSTEM_PROMPT, self.model, *map(str, settings), digest.hexdigest())
+    
+    async def _detect_issues(self, job_id: str, use_batch_api: Optional[bool] = None) -> AsyncIterator[List[Issue]]:
+        """Yield newly detected, deduplicated issues as each analysis stage or LLM request finishes"""
+        file_service = self.file_service
+        ast_service = self.ast_service
+        # Issues are deduplicated across batches, so earlier stages still win as before
+        seen: Set[Tuple[str, int, Optional[str]]] = set()
         
         # Use AST analysis for better issue detection
-        ast_issues = await ast_service.analyze_files_ast(job_id)
+        ast_issues, ast_covered = await ast_service.analyze_files_ast(job_id)
         
-        # Also run traditional regex-based analysis as fallback
+        # Also run traditional regex-based analysis as fallback for files the AST did not cover
         files = file_service.get_original_files(job_id)
-        regex_issues = []
+        self._job_suffixes[job_id] = frozenset(file_path.suffix for file_path in files)
+        results = await asyncio.gather(
+            *[self._analyze_file(file_path, run_static=file_path not in ast_covered) for file_path in files],
+            return_exceptions=True
+        )
+        
+        if use_batch_api is None:
+            use_batch_api = self.use_batch_api
         
-        for file_path in files:
-            issues = await self._analyze_file(file_path)
+        ast_counts = Counter(issue.file_path for issue in ast_issues)
+        regex_issues = []
+        llm_inputs = []
+        for file_path, result in zip(files, results):
+            if isinstance(result, Exception):
+                print(f"Error analyzing file {file_path}: {result}")
+                continue
+            size, head, issues = result
             regex_issues.extend(issues)
+            if not size:
+                continue
+            # The Batch API is cheap enough to still cover files the static pass has saturated
+            static_count = len(issues) + ast_counts[str(file_path)]
+            if not use_batch_api and self._skip_llm(static_count, size):
+                print(f"Skipping LLM analysis for {file_path}: {static_count} static issues, {size} bytes")
+                continue
+            llm_inputs.append((file_path, self._llm_text(head)))
+        
+        # Static findings can be fixed while the LLM is still analyzing
+        static_issues = self._deduplicate_issues(ast_issues + regex_issues, seen)
+        if static_issues:
+            yield static_issues
+        
+        # Serve unchanged files from the LLM cache
+        cached_issues = []
+        uncached_inputs = []
+        for file_path, content in llm_inputs:
+            cached = await self.llm_cache.get(self._llm_cache_key(file_path, content))
+            if cached is None:
+                uncached_inputs.append((file_path, content))
+            else:
+                cached_issues.extend(
+                    Issue.model_construct(**{**issue, "file_path": str(file_path)}) for issue in cached
+                )
+        llm_inputs = uncached_inputs
+        if cached_issues:
+            print(f"LLM cache stats: {self.llm_cache.stats}")
+            cached_issues = self._deduplicate_issues(cached_issues, seen)
+            if cached_issues:
+                yield cached_issues
+        
+        # Use LLM for additional analysis, several files per request
+        batches = self._batch_llm_inputs(llm_inputs)
         
-        # Combine and deduplicate issues
-        all_issues = self._deduplicate_issues(ast_issues + regex_issues)
+        if use_batch_api:
+            llm_issues = self._deduplicate_issues(await self._llm_analyze_with_batch_api(batches), seen)
+            if llm_issues:
+                yield llm_issues
+            return
         
-        return all_issues
+        # Hand each request's issues on as soon as it answers rather than waiting for the slowest
+        tasks = [asyncio.create_task(self._llm_analyze_files(batch)) for batch in batches]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                llm_issues = self._deduplicate_issues(await next_result, seen)
+                if llm_issues:
+                    yield llm_issues
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    def _batch_llm_inputs(self, llm_inputs: List[Tuple[Path, str]]) -> List[List[Tuple[Path, str]]]:
+        """Group files into LLM requests bounded by file count and an estimated token budget"""
+        batches = []
+        batch = []
+        batch_tokens = 0
+        for file_path, content in llm_inputs:
+            # ~4 characters per token is close enough for packing and avoids re-tokenizing
+            tokens = len(content) // 4 + 1
+            if batch and (len(batch) >= self.llm_batch_size or batch_tokens + tokens > self.llm_batch_tokens):
+                batches.append(batch)
+                batch = []
+                batch_tokens = 0
+            batch.append((file_path, content))
+            batch_tokens += tokens
+        if batch:
+            batches.append(batch)
+        return batches
+    
+    def _skip_llm(self, static_count: int, size: int) -> bool:
+        """Whether static findings make a real-time LLM pass over a file not worth its cost"""
+        if static_count >= self.static_issue_cap or size > self.max_llm_bytes:
+            return True
+        # Small files are fully covered by the static checks once those have found something
+        return static_count > 0 and size < self.llm_small_file_bytes
     
-    def _deduplicate_issues(self, issues: List[Issue]) -> List[Issue]:
-        """Remove duplicate issues based on file path and line number"""
-        seen = set()
+    def _deduplicate_issues(self, issues: List[Issue], seen: Optional[Set[Tuple[str, int, Optional[str]]]] = None) -> List[Issue]:
+        """Remove duplicate issues based on file path and line number, including ones already in seen"""
+        if seen is None:
+            seen = set()
+        # The first issue seen for each key wins
         unique_issues = []
-        
         for issue in issues:
             key = (issue.file_path, issue.line_start, issue.rule_id)
             if key not in seen:
@@ -53,53 +494,108 @@ class BrainAgent:
         
         return unique_issues
     
-    async def coordinate_fixing_process(self, job_id: str, issues: List[Issue]) -> Dict[str, Any]:
-        """Coordinate the complete fixing process with POUR agents"""
-        from agents.pour_agents import POURAgents
-        from services.file_service import FileService
-        from services.validation_service import ValidationService
-        from services.report_service import ReportService
-        from services.performance_service import PerformanceService
+    async def coordinate_fixing_process(
+        self,
+        job_id: str,
+        issues: List[Issue],
+        on_agent_done: Optional[Callable[[str, int, int], Awaitable[None]]] = None
+    ) -> Dict[str, Any]:
+        """Coordinate the complete fixing process with POUR agents, reporting each finished category"""
+        async def single_batch():
+            yield issues
         
-        # Initialize services
-        pour_agents = POURAgents()
-        file_service = FileService()
-        validation_service = ValidationService()
-        report_service = ReportService()
-        performance_service = PerformanceService()
-        
-        # Step 1: Generate work plan and classify issues into POUR categories
-        work_plan = await performance_service.monitor_performance(
-            "work_plan_generation", 
-            self._generate_work_plan, 
-            issues
-        )
+        try:
+            return await self._fix_pipeline(job_id, single_batch(), on_agent_done)
+        finally:
+            # The report consumes the job's suffixes; a job that fails first must not leave them behind
+            self._job_suffixes.pop(job_id, None)
+    
+    async def detect_and_fix(
+        self,
+        job_id: str,
+        on_agent_done: Optional[Callable[[str, int, int], Awaitable[None]]] = None
+    ) -> Dict[str, Any]:
+        """Detect issues and fix them in one pipeline, handing each batch to the POUR agents as it is found"""
+        try:
+            return await self._fix_pipeline(job_id, self.stream_issues(job_id), on_agent_done)
+        finally:
+            # The report consumes the job's suffixes; a job that fails first must not leave them behind
+            self._job_suffixes.pop(job_id, None)
+    
+    async def _fix_pipeline(
+        self,
+        job_id: str,
+        batches: AsyncIterator[List[Issue]],
+        on_agent_done: Optional[Callable[[str, int, int], Awaitable[None]]] = None
+    ) -> Dict[str, Any]:
+        """Fix each batch of issues as it arrives, then patch, validate and report once all are fixed"""
+        pour_agents = self.pour_agents
+        file_service = self.file_service
+        validation_service = self.validation_service
+        report_service = self.report_service
+        performance_service = self.performance_service
+        
+        # Step 1: Send each batch's issues to the POUR agents by category as soon as it arrives
+        completed = 0
+        started = 0
+        
+        async def run_agent(category: str, category_issues: List[Issue]) -> List[Fix]:
+            nonlocal completed
+            fixes = await performance_service.monitor_performance(
+                f"pour_agent_{category}",
+                self._get_fixes_from_agent,
+                pour_agents, 
+                category, 
+                category_issues
+            )
+            # Let the caller surface progress while other agents and detection are still running;
+            # the total grows as long as new batches keep arriving
+            completed += 1
+            if on_agent_done is not None:
+                await on_agent_done(category, completed, started)
+            return fixes
+        
+        issues = []
+        pending = []
+        tasks = []
+        try:
+            async for batch in batches:
+                issues.extend(batch)
+                for category, category_issues in self._classify_issues(batch).items():
+                    print(f"Processing {len(category_issues)} {category} issues...")
+                    started += 1
+                    pending.append((category, category_issues))
+                    tasks.append(asyncio.create_task(run_agent(category, category_issues)))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        
+        # Step 2: Generate the work plan from all issues while the last agents finish
         classified_issues = self._classify_issues(issues)
+        work_plan, fix_lists = await asyncio.gather(
+            performance_service.monitor_performance(
+                "work_plan_generation", 
+                self._generate_work_plan, 
+                issues,
+                classified_issues
+            ),
+            asyncio.gather(*tasks)
+        )
         
-        # Step 2: Send issues to POUR agents and get fixes
         all_fixes = []
         agent_reports = {}
         
-        for category, category_issues in classified_issues.items():
-            if category_issues:
-                print(f"Processing {len(category_issues)} {category} issues...")
-                
-                # Get fixes from the appropriate agent with performance monitoring
-                fixes = await performance_service.monitor_performance(
-                    f"pour_agent_{category}",
-                    self._get_fixes_from_agent,
-                    pour_agents, 
-                    category, 
-                    category_issues
-                )
-                all_fixes.extend(fixes)
-                
-                # Generate agent report
-                agent_reports[category] = {
-                    "issues_count": len(category_issues),
-                    "fixes_count": len(fixes),
-                    "fixes": fixes
-                }
+        for (category, category_issues), fixes in zip(pending, fix_lists):
+            all_fixes.extend(fixes)
+            
+            # Generate agent report, merging the batches of each category
+            report = agent_reports.setdefault(category, {"issues_count": 0, "fixes_count": 0, "fixes": []})
+            report["issues_count"] += len(category_issues)
+            report["fixes_count"] += len(fixes)
+            report["fixes"].extend(fixes)
+        if pattern_stats:
+            print(f"Pattern fix stats: {dict(pattern_stats)}")
         
         # Step 3: Apply fixes to files with line-aware patching
         await performance_service.monitor_performance(
@@ -140,11 +636,13 @@ class BrainAgent:
         )
         
         # Step 7: Save enhanced metadata for frontend
+        issue_dicts = [issue.model_dump() for issue in issues]
+        stats = self._compute_summary_stats(issues)
         report_data = {
             # Core data
             "work_plan": work_plan,
-            "issues": [issue.dict() for issue in issues],
-            "fixes": [fix.dict() for fix in all_fixes],
+            "issues": issue_dicts,
+            "fixes": [fix.model_dump() for fix in all_fixes],
             "validation_results": validation_results,
             "agent_reports": agent_reports,
             
@@ -152,14 +650,14 @@ class BrainAgent:
             "summary": {
                 "total_issues": len(issues),
                 "total_fixes": len(all_fixes),
-                "issues_by_category": self._categorize_issues_for_summary(issues),
-                "issues_by_severity": self._categorize_issues_by_severity(issues),
+                "issues_by_category": stats.issues_by_category,
+                "issues_by_severity": stats.issues_by_severity,
                 "fixes_by_category": self._categorize_fixes_for_summary(all_fixes, issues),
                 "validation_passed": validation_results.get("passed", False),
                 "remaining_issues": validation_results.get("remaining_issues", 0),
                 "compliance_score": validation_results.get("summary", {}).get("compliance_score", 0.0),
                 "processing_time": self._calculate_processing_time(),
-                "files_processed": len(set(issue.file_path for issue in issues))
+                "files_processed": stats.files_processed
             },
             
             # Performance metrics
@@ -169,15 +667,15 @@ class BrainAgent:
             "accessibility_compliance": {
                 "wcag_level": self._determine_wcag_level(validation_results),
                 "pour_compliance": self._calculate_pour_compliance(issues, all_fixes),
-                "critical_issues": [issue.dict() for issue in issues if issue.severity == "high"],
-                "recommendations": self._generate_recommendations(issues, validation_results)
+                "critical_issues": [issue for issue in issue_dicts if issue["severity"] == "high"],
+                "recommendations": self._generate_recommendations(stats, validation_results)
             },
             
             # File analysis details
             "file_analysis": {
                 "supported_files": self._get_supported_files(job_id),
-                "file_types": self._analyze_file_types(issues),
-                "complexity_score": self._calculate_complexity_score(issues)
+                "file_types": stats.file_types,
+                "complexity_score": stats.complexity_score
             },
             
             # Agent performance
@@ -207,8 +705,12 @@ class BrainAgent:
         
         # Save as report.json for frontend consumption
         report_json_path = file_service.get_report_json_path(job_id)
-        async with aiofiles.open(report_json_path, 'w', encoding='utf-8') as f:
-            await f.write(json.dumps(report_data, indent=2, default=str))
+        options = orjson.OPT_NON_STR_KEYS
+        if os.getenv("REPORT_JSON_PRETTY", "false").lower() == "true":
+            options |= orjson.OPT_INDENT_2
+        payload = orjson.dumps(report_data, default=str, option=options)
+        # One large write is cheaper as a single thread-pool call than chunked aiofiles awaits
+        await asyncio.to_thread(report_json_path.write_bytes, payload)
         
         # Also save as metadata.json for internal use
         await file_service.save_job_metadata(job_id, report_data)
@@ -221,20 +723,6 @@ class BrainAgent:
             "work_plan": work_plan
         }
     
-    def _categorize_issues_for_summary(self, issues: List[Issue]) -> Dict[str, int]:
-        """Categorize issues for summary display"""
-        categories = {}
-        for issue in issues:
-            categories[issue.category] = categories.get(issue.category, 0) + 1
-        return categories
-    
-    def _categorize_issues_by_severity(self, issues: List[Issue]) -> Dict[str, int]:
-        """Categorize issues by severity for summary display"""
-        severities = {}
-        for issue in issues:
-            severities[issue.severity] = severities.get(issue.severity, 0) + 1
-        return severities
-    
     def _categorize_fixes_for_summary(self, fixes: List[Fix], issues: List[Issue]) -> Dict[str, int]:
         """Categorize fixes by category for summary display"""
         categories = {}
@@ -252,9 +740,7 @@ class BrainAgent:
     
     async def _get_performance_metrics(self, job_id: str) -> Dict[str, Any]:
         """Get performance metrics for the job"""
-        from services.performance_service import PerformanceService
-        performance_service = PerformanceService()
-        return await performance_service.get_job_metrics(job_id)
+        return await self.performance_service.get_job_metrics(job_id)
     
     def _determine_wcag_level(self, validation_results: Dict[str, Any]) -> str:
         """Determine WCAG compliance level"""
@@ -268,63 +754,69 @@ class BrainAgent:
     
     def _calculate_pour_compliance(self, issues: List[Issue], fixes: List[Fix]) -> Dict[str, float]:
         """Calculate POUR compliance scores"""
-        categories = ["perceivable", "operable", "understandable", "robust"]
+        category_by_id = {issue.id: issue.category for issue in issues}
+        issue_counts = Counter(issue.category for issue in issues)
+        fix_counts = Counter(category_by_id.get(fix.issue_id) for fix in fixes)
         compliance = {}
         
-        for category in categories:
-            category_issues = [i for i in issues if i.category == category]
-            category_fixes = [f for f in fixes if any(i.category == category for i in issues if i.id == f.issue_id)]
-            
-            if category_issues:
-                compliance[category] = len(category_fixes) / len(category_issues)
+        for category in POUR_CATEGORIES:
+            if issue_counts[category]:
+                compliance[category] = fix_counts[category] / issue_counts[category]
             else:
                 compliance[category] = 1.0
         
         return compliance
     
-    def _generate_recommendations(self, issues: List[Issue], validation_results: Dict[str, Any]) -> List[str]:
+    def _generate_recommendations(self, stats: SummaryStats, validation_results: Dict[str, Any]) -> List[str]:
         """Generate accessibility recommendations"""
         recommendations = []
         
         if validation_results.get("remaining_issues", 0) > 0:
             recommendations.append("Review and address remaining accessibility issues")
         
-        high_severity_issues = [i for i in issues if i.severity == "high"]
-        if high_severity_issues:
-            recommendations.append(f"Address {len(high_severity_issues)} high-severity accessibility issues")
+        high_severity_count = stats.issues_by_severity.get("high", 0)
+        if high_severity_count:
+            recommendations.append(f"Address {high_severity_count} high-severity accessibility issues")
         
-        if any(i.category == "perceivable" for i in issues):
+        if stats.issues_by_category.get("perceivable"):
             recommendations.append("Ensure all images have descriptive alt text")
         
-        if any(i.category == "operable" for i in issues):
+        if stats.issues_by_category.get("operable"):
             recommendations.append("Verify keyboard navigation and focus management")
         
         return recommendations
     
     def _get_supported_files(self, job_id: str) -> List[str]:
         """Get list of supported file types in the job"""
-        from services.file_service import FileService
-        file_service = FileService()
-        files = file_service.get_original_files(job_id)
-        return list(set(f.suffix for f in files))
+        # Reuse the suffixes recorded while listing files for analysis instead of walking the job again
+        suffixes = self._job_suffixes.pop(job_id, None)
+        if suffixes is None:
+            suffixes = frozenset(f.suffix for f in self.file_service.get_original_files(job_id))
+        return list(suffixes)
     
-    def _analyze_file_types(self, issues: List[Issue]) -> Dict[str, int]:
-        """Analyze file types from issues"""
-        file_types = {}
+    def _compute_summary_stats(self, issues: List[Issue]) -> SummaryStats:
+        """Collect the per-issue report statistics in a single pass"""
+        stats = SummaryStats()
+        issues_by_file = {}
+        total_weight = 0
+        
         for issue in issues:
-            file_ext = Path(issue.file_path).suffix
-            file_types[file_ext] = file_types.get(file_ext, 0) + 1
-        return file_types
-    
-    def _calculate_complexity_score(self, issues: List[Issue]) -> float:
-        """Calculate complexity score based on issues"""
-        if not issues:
-            return 0.0
+            stats.issues_by_category[issue.category] = stats.issues_by_category.get(issue.category, 0) + 1
+            stats.issues_by_severity[issue.severity] = stats.issues_by_severity.get(issue.severity, 0) + 1
+            issues_by_file[issue.file_path] = issues_by_file.get(issue.file_path, 0) + 1
+            total_weight += SEVERITY_WEIGHTS.get(issue.severity, 1)
+        
+        # Resolve each file's extension once rather than once per issue, without building Paths
+        for file_path, count in issues_by_file.items():
+            file_ext = os.path.splitext(file_path)[1]
+            stats.file_types[file_ext] = stats.file_types.get(file_ext, 0) + count
+        stats.files_processed = len(issues_by_file)
         
-        # Simple complexity calculation based on issue count and severity
-        severity_weights = {"high": 3, "medium": 2, "low": 1}
-        total_weight = sum(severity_weights.get(issue.severity, 1) for issue in issues)
-        return min(total_weight / len(issues), 3.0)  # Normalize to 0-3 scale
+        # Simple complexity calculation based on issue count and severity, normalized to 0-3
+        if issues:
+            stats.complexity_score = min(total_weight / len(issues), 3.0)
+        
+        return stats
     
     def _get_job_creation_time(self, job_id: str) -> str:
         """Get job creation time (placeholder)"""
@@ -336,18 +828,13 @@ class BrainAgent:
         from datetime import datetime
         return datetime.now().isoformat()
     
-    async def _generate_work_plan(self, issues: List[Issue]) -> Dict[str, Any]:
+    async def _generate_work_plan(self, issues: List[Issue], classified_issues: Dict[str, List[Issue]]) -> Dict[str, Any]:
         """Generate a detailed structured work plan for POUR agents"""
-        from services.work_plan_service import WorkPlanService
-        
-        work_plan_service = WorkPlanService()
-        return work_plan_service.generate_work_plan(issues)
+        return self.work_plan_service.generate_work_plan(issues, classified_issues)
     
     async def _handle_residual_issues(self, job_id: str, validation_results: Dict[str, Any], pour_agents) -> List[Fix]:
         """Handle residual issues by re-routing to appropriate agents"""
-        from services.rerouting_service import ReroutingService
-        
-        rerouting_service = ReroutingService()
+        rerouting_service = self.rerouting_service
         
         # Analyze validation results to identify residual issues
         residual_issues = await rerouting_service.analyze_residual_issues(job_id, validation_results)
@@ -375,219 +862,207 @@ class BrainAgent:
         return rerouted_fixes
     
     def _classify_issues(self, issues: List[Issue]) -> Dict[str, List[Issue]]:
-        """Classify issues into POUR categories"""
-        classified = {
-            "perceivable": [],
-            "operable": [],
-            "understandable": [],
-            "robust": []
-        }
+        """Classify issues into POUR categories, omitting categories with no issues"""
+        classified = {category: [] for category in POUR_CATEGORIES}
         
         for issue in issues:
-            if issue.category in classified:
-                classified[issue.category].append(issue)
+            bucket = classified.get(issue.category)
+            if bucket is not None:
+                bucket.append(issue)
         
-        return classified
+        return {category: bucket for category, bucket in classified.items() if bucket}
     
     async def _get_fixes_from_agent(self, pour_agents, category: str, issues: List[Issue]) -> List[Fix]:
         """Get fixes from the appropriate POUR agent"""
-        if category == "perceivable":
-            return await pour_agents.perceivable_agent.fix_issues(issues)
-        elif category == "operable":
-            return await pour_agents.operable_agent.fix_issues(issues)
-        elif category == "understandable":
-            return await pour_agents.understandable_agent.fix_issues(issues)
-        elif category == "robust":
-            return await pour_agents.robust_agent.fix_issues(issues)
-        else:
+        agent = pour_agents.agents.get(category)
+        if agent is None:
             return []
+        return await agent.fix_issues(issues)
     
-    async def _analyze_file(self, file_path: Path) -> List[Issue]:
-        """Analyze a single file for accessibility issues"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-        except Exception as e:
-            print(f"Error reading file {file_path}: {e}")
-            return []
-        
-        issues = []
-        
-        # Static analysis based on file type
-        if file_path.suffix in ['.html', '.jsx', '.tsx']:
-            issues.extend(await self._analyze_html_jsx(file_path, content))
-        elif file_path.suffix in ['.js', '.ts']:
-            issues.extend(await self._analyze_js_ts(file_path, content))
-        elif file_path.suffix == '.css':
-            issues.extend(await self._analyze_css(file_path, content))
-        
-        # Use LLM for additional analysis
-        llm_issues = await self._llm_analyze_file(file_path, content)
-        issues.extend(llm_issues)
+    async def _analyze_file(self, file_path: Path, run_static: bool = True) -> Tuple[int, bytes, List[Issue]]:
+        """Run static analysis on a single file, returning its size, the head kept for the LLM and the issues found"""
+        async with self._sem:
+            try:
+                # Without static analysis only the head the LLM pass uses is read
+                if not run_static:
+                    size, head = await asyncio.to_thread(_read_head, file_path, self.llm_prefix_bytes)
+                    return size, head, []
+                # One thread-pool hop for open/read/close instead of one per aiofiles call
+                content = await asyncio.to_thread(file_path.read_bytes)
+            except OSError as e:
+                print(f"Error reading file {file_path}: {e}")
+                return 0, b"", []
+            
+            # Scanning is CPU-bound, so it runs in the process pool and off the event loop
+            pool = self._get_process_pool()
+            if pool is None:
+                issues = await asyncio.to_thread(analyze_content, file_path, content)
+            else:
+                issues = await asyncio.get_running_loop().run_in_executor(pool, analyze_content, file_path, content)
+            # Only the head outlives this call, so full file buffers are not held until the LLM pass
+            return len(content), content[:self.llm_prefix_bytes], issues
+    
+    def _get_process_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Create the static analysis process pool on first use"""
+        if self._process_pool is None and self.analysis_processes > 0:
+            self._process_pool = ProcessPoolExecutor(max_workers=self.analysis_processes)
+        return self._process_pool
+    
+    def _build_llm_request(self, files: List[Tuple[Path, str]]) -> Dict[str, Any]:
+        """Build the chat completion request body for a batch of files"""
+        batch = [
+            {
+                "file_id": file_id,
+                "suffix": file_path.suffix,
+                "content": content
+            }
+            for file_id, (file_path, content) in enumerate(files)
+        ]
         
-        return issues
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": orjson.dumps(batch).decode("utf-8")}
+            ],
+            "temperature": 0.1,
+            "response_format": {"type": "json_object"}
+        }
     
-    async def _analyze_html_jsx(self, file_path: Path, content: str) -> List[Issue]:
-        """Analyze HTML/JSX files for accessibility issues"""
-        issues = []
-        lines = content.split('\n')
-        
-        # Check for missing alt attributes
-        for i, line in enumerate(lines):
-            if re.search(r'<img[^>]*(?!alt=)', line) and 'alt=' not in line:
-                issues.append(Issue(
-                    id=f"{file_path.name}_{i+1}_missing_alt",
-                    file_path=str(file_path),
-                    line_start=i+1,
-                    line_end=i+1,
-                    category="perceivable",
-                    severity="high",
-                    description="Image missing alt attribute",
-                    code_snippet=line.strip(),
-                    rule_id="img-alt"
-                ))
-        
-        # Check for missing form labels
-        for i, line in enumerate(lines):
-            if re.search(r'<input[^>]*(?!aria-label|id=.*for)', line) and 'label' not in line:
-                issues.append(Issue(
-                    id=f"{file_path.name}_{i+1}_missing_label",
-                    file_path=str(file_path),
-                    line_start=i+1,
-                    line_end=i+1,
-                    category="operable",
-                    severity="high",
-                    description="Input missing label or aria-label",
-                    code_snippet=line.strip(),
-                    rule_id="label"
-                ))
-        
-        # Check for missing heading hierarchy
-        headings = []
-        for i, line in enumerate(lines):
-            heading_match = re.search(r'<h([1-6])', line)
-            if heading_match:
-                level = int(heading_match.group(1))
-                headings.append((i+1, level))
-        
-        for i, (line_num, level) in enumerate(headings):
-            if i > 0 and level > headings[i-1][1] + 1:
-                issues.append(Issue(
-                    id=f"{file_path.name}_{line_num}_heading_skip",
-                    file_path=str(file_path),
-                    line_start=line_num,
-                    line_end=line_num,
-                    category="understandable",
-                    severity="medium",
-                    description="Heading level skipped",
-                    code_snippet=lines[line_num-1].strip(),
-                    rule_id="heading-order"
-                ))
+    def _llm_cache_key(self, file_path: Path, content: str) -> str:
+        """Cache key covering everything that determines the LLM analysis of a file"""
+        return LLMCache.make_key(self.model, SYSTEM_PROMPT, file_path.suffix, content)
+    
+    async def _cache_llm_results(self, files: List[Tuple[Path, str]], issues: List[Issue]) -> None:
+        """Store parsed LLM issues per file, including files with no issues"""
+        issues_by_file = {str(file_path): [] for file_path, _ in files}
+        for issue in issues:
+            if issue.file_path in issues_by_file:
+                issues_by_file[issue.file_path].append(issue.model_dump())
         
-        return issues
+        for file_path, content in files:
+            await self.llm_cache.set(self._llm_cache_key(file_path, content), issues_by_file[str(file_path)])
     
-    async def _analyze_js_ts(self, file_path: Path, content: str) -> List[Issue]:
-        """Analyze JS/TS files for accessibility issues"""
+    def _parse_llm_result(self, files: List[Tuple[Path, str]], result: str) -> List[Issue]:
+        """Parse an LLM analysis response and map issues back to their files"""
+        # JSON mode guarantees the response is a single JSON object
+        results_data = orjson.loads(result)
         issues = []
-        lines = content.split('\n')
-        
-        # Check for missing ARIA attributes in event handlers
-        for i, line in enumerate(lines):
-            if 'onClick' in line and 'aria-label' not in line and 'aria-labelledby' not in line:
-                if re.search(r'<[^>]*onClick', line):
-                    issues.append(Issue(
-                        id=f"{file_path.name}_{i+1}_missing_aria",
-                        file_path=str(file_path),
-                        line_start=i+1,
-                        line_end=i+1,
-                        category="operable",
-                        severity="medium",
-                        description="Interactive element missing ARIA label",
-                        code_snippet=line.strip(),
-                        rule_id="aria-label"
-                    ))
-        
+        skipped = 0
+        for entry in results_data.get("results", []):
+            if not isinstance(entry, dict):
+                continue
+            file_id = entry.get("file_id")
+            if not isinstance(file_id, int) or not 0 <= file_id < len(files):
+                continue
+            file_path = files[file_id][0]
+            # Issues are validated one by one so a malformed entry does not discard the whole batch
+            for issue in entry.get("issues", []):
+                try:
+                    issues.append(Issue(**{**issue, "file_path": str(file_path)}))
+                except (TypeError, ValidationError):
+                    skipped += 1
+        if skipped:
+            print(f"Skipped {skipped} malformed issues in the LLM analysis of {[str(file_path) for file_path, _ in files]}")
         return issues
     
-    async def _analyze_css(self, file_path: Path, content: str) -> List[Issue]:
-        """Analyze CSS files for accessibility issues"""
-        issues = []
-        lines = content.split('\n')
-        
-        # Check for color contrast issues (simplified)
-        for i, line in enumerate(lines):
-            if 'color:' in line and 'background' not in line.lower():
-                # This is a simplified check - in production, use proper color contrast analysis
-                issues.append(Issue(
-                    id=f"{file_path.name}_{i+1}_color_contrast",
-                    file_path=str(file_path),
-                    line_start=i+1,
-                    line_end=i+1,
-                    category="perceivable",
-                    severity="medium",
-                    description="Potential color contrast issue - verify with tools",
-                    code_snippet=line.strip(),
-                    rule_id="color-contrast"
-                ))
+    async def _llm_analyze_files(self, files: List[Tuple[Path, str]]) -> List[Issue]:
+        """Use LLM to analyze a batch of files for accessibility issues in a single request"""
+        async with self._sem:
+            try:
+                result = await self._stream_json_completion(self._build_llm_request(files))
+                issues = self._parse_llm_result(files, result)
+                await self._cache_llm_results(files, issues)
+                return issues
+            
+            except Exception as e:
+                self.llm_failures += 1
+                print(f"LLM analysis failed for {[str(file_path) for file_path, _ in files]}: {e}")
         
-        return issues
+        return []
     
-    async def _llm_analyze_file(self, file_path: Path, content: str) -> List[Issue]:
-        """Use LLM to analyze file for accessibility issues"""
+    async def _llm_analyze_with_batch_api(self, batches: List[List[Tuple[Path, str]]]) -> List[Issue]:
+        """Analyze all file batches through a single OpenAI Batch API job"""
+        if not batches:
+            return []
+        
         try:
-            prompt = f"""
-            Analyze this {file_path.suffix} file for accessibility issues. Focus on WCAG 2.1 guidelines.
-            Return a JSON array of issues with this structure:
-            [
-                {{
-                    "id": "unique_id",
-                    "file_path": "{file_path}",
-                    "line_start": line_number,
-                    "line_end": line_number,
-                    "category": "perceivable|operable|understandable|robust",
-                    "severity": "high|medium|low",
-                    "description": "Issue description",
-                    "code_snippet": "relevant code",
-                    "rule_id": "wcag_rule_id"
-                }}
-            ]
-            
-            File content:
-            {content[:2000]}  # Limit content to avoid token limits
-            """
-            
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": "You are an accessibility expert. Analyze code for WCAG 2.1 compliance issues."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.1
-            )
-            
-            result = response.choices[0].message.content
-            # Extract JSON from response
-            json_match = re.search(r'\[.*\]', result, re.DOTALL)
-            if json_match:
-                issues_data = json.loads(json_match.group())
-                return [Issue(**issue) for issue in issues_data]
-            
+            batch_id = await self._submit_batch([
+                {"custom_id": str(batch_index), "body": self._build_llm_request(files)}
+                for batch_index, files in enumerate(batches)
+            ])
+            print(f"Submitted OpenAI batch {batch_id} for {len(batches)} LLM analysis requests")
+            results = await self._await_batch(batch_id)
         except Exception as e:
-            print(f"LLM analysis failed for {file_path}: {e}")
+            self.llm_failures += 1
+            print(f"Batch API analysis failed: {e}")
+            return []
         
-        return []
+        issues = []
+        for batch_index, files in enumerate(batches):
+            result = results.get(str(batch_index))
+            if result is None:
+                self.llm_failures += 1
+                continue
+            try:
+                batch_issues = self._parse_llm_result(files, result)
+                await self._cache_llm_results(files, batch_issues)
+                issues.extend(batch_issues)
+            except Exception as e:
+                self.llm_failures += 1
+                print(f"LLM analysis failed for {[str(file_path) for file_path, _ in files]}: {e}")
+        return issues
     
-    async def create_work_plan(self, issues: List[Issue]) -> Dict[str, List[Issue]]:
-        """Create work plan by categorizing issues for POUR agents"""
-        plan = {
-            "perceivable": [],
-            "operable": [],
-            "understandable": [],
-            "robust": []
-        }
+    async def _submit_batch(self, requests: List[Dict[str, Any]]) -> str:
+        """Upload chat completion requests as JSONL and create a batch, returning its id"""
+        lines = [
+            orjson.dumps({
+                "custom_id": request["custom_id"],
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": request["body"]
+            })
+            for request in requests
+        ]
         
-        for issue in issues:
-            if issue.category in plan:
-                plan[issue.category].append(issue)
+        batch_file = await self.client.files.create(
+            file=("brain_analysis.jsonl", b"\n".join(lines)),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h"
+        )
+        return batch.id
+    
+    async def _await_batch(self, batch_id: str) -> Dict[str, str]:
+        """Poll a batch with exponential backoff and return response contents by custom_id"""
+        delay = 5.0
+        while True:
+            batch = await self.client.batches.retrieve(batch_id)
+            if batch.status == "completed":
+                break
+            if batch.status in ("failed", "expired", "cancelled"):
+                raise RuntimeError(f"Batch {batch_id} ended with status {batch.status}")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 300.0)
+        
+        if not batch.output_file_id:
+            return {}
         
-        return plan
+        output = await self.client.files.content(batch.output_file_id)
+        results = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            response = record.get("response") or {}
+            if response.get("status_code") != 200:
+                continue
+            results[record["custom_id"]] = response["body"]["choices"][0]["message"]["content"]
+        return results
+    
+    async def create_work_plan(self, issues: List[Issue]) -> Dict[str, List[Issue]]:
+        """Create work plan by categorizing issues for POUR agents"""
+        return self._classify_issues(issues)
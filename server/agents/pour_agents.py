@@ -1,9 +1,11 @@
+import asyncio
 from typing import List
 from models.job import Issue, Fix
 from .perceivable_agent import PerceivableAgent
 from .operable_agent import OperableAgent
 from .understandable_agent import UnderstandableAgent
 from .robust_agent import RobustAgent
+from ._llm import aclose_fix_client
 
 class POURAgents:
     def __init__(self):
@@ -11,28 +13,31 @@ class POURAgents:
         self.operable_agent = OperableAgent()
         self.understandable_agent = UnderstandableAgent()
         self.robust_agent = RobustAgent()
+        self.agents = {
+            "perceivable": self.perceivable_agent,
+            "operable": self.operable_agent,
+            "understandable": self.understandable_agent,
+            "robust": self.robust_agent
+        }
     
     async def fix_issues(self, job_id: str, issues: List[Issue]) -> List[Fix]:
         """Fix issues using POUR agents"""
-        fixes = []
-        
         # Group issues by category
-        perceivable_issues = [i for i in issues if i.category == "perceivable"]
-        operable_issues = [i for i in issues if i.category == "operable"]
-        understandable_issues = [i for i in issues if i.category == "understandable"]
-        robust_issues = [i for i in issues if i.category == "robust"]
-        
-        # Process each category with dedicated agents
-        if perceivable_issues:
-            fixes.extend(await self.perceivable_agent.fix_issues(perceivable_issues))
-        
-        if operable_issues:
-            fixes.extend(await self.operable_agent.fix_issues(operable_issues))
+        grouped = {category: [] for category in self.agents}
+        for issue in issues:
+            bucket = grouped.get(issue.category)
+            if bucket is not None:
+                bucket.append(issue)
         
-        if understandable_issues:
-            fixes.extend(await self.understandable_agent.fix_issues(understandable_issues))
+        # Categories are independent, so their agents run concurrently
+        results = await asyncio.gather(*[
+            self.agents[category].fix_issues(category_issues)
+            for category, category_issues in grouped.items()
+            if category_issues
+        ])
         
-        if robust_issues:
-            fixes.extend(await self.robust_agent.fix_issues(robust_issues))
-        
-        return fixes
+        return [fix for fixes in results for fix in fixes]
+    
+    async def aclose(self) -> None:
+        """Close the LLM connections shared by the POUR agents"""
+        await aclose_fix_client()
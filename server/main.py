@@ -1,31 +1,34 @@
 import os
 import uuid
+import time
 import asyncio
-import json
+import functools
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Any, Optional, List
-from fastapi import FastAPI, File, UploadFile, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, File, UploadFile, HTTPException
+from fastapi.responses import FileResponse, ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 import uvicorn
 import aiofiles
+import orjson
 from dotenv import load_dotenv
 
-from agents.brain_agent import BrainAgent
-from agents.pour_agents import POURAgents
+from agents._llm_cache import prune_llm_cache
 from services.file_service import FileService, MAX_FILES_COUNT
-from services.validation_service import ValidationService
-from services.report_service import ReportService
 from services.security_service import SecurityService
 from services.performance_service import PerformanceService
 from services.telemetry_service import TelemetryService, EventType
 from services.error_handler import ErrorHandler, ErrorCategory, ErrorSeverity
+from services.job_store import JobStore
+from services.job_queue import JobQueue
+from services.response_cache import ResponseCache
 from models.job import Job, JobStatus
 
 load_dotenv('.env')
 
-app = FastAPI(title="DF-InfoUI", version="1.0.0")
+app = FastAPI(title="DF-InfoUI", version="1.0.0", default_response_class=ORJSONResponse)
 
 # CORS middleware
 app.add_middleware(
@@ -38,17 +41,43 @@ app.add_middleware(
 
 # Initialize services
 file_service = FileService()
-brain_agent = BrainAgent()
-pour_agents = POURAgents()
-validation_service = ValidationService()
-report_service = ReportService()
 security_service = SecurityService()
 performance_service = PerformanceService()
 telemetry_service = TelemetryService()
 error_handler = ErrorHandler()
 
-# In-memory job storage (in production, use Redis or database)
-jobs: Dict[str, Job] = {}
+@functools.cache
+def get_brain_agent():
+    """BrainAgent, created when job workers start so API processes that never run jobs skip its LLM and report imports"""
+    from agents.brain_agent import BrainAgent
+    return BrainAgent()
+
+# Job status lives in Redis when REDIS_URL is set so every uvicorn worker sees it
+job_store = JobStore()
+
+# Uploaded jobs wait here for one of the JOB_WORKERS workers started at startup, or for
+# worker.py processes reading a Redis stream when JOB_QUEUE=redis
+job_queue = JobQueue()
+job_workers: List[asyncio.Task] = []
+
+# Reports of complete jobs never change, so their serialized JSON is served from a cache
+response_cache = ResponseCache()
+REPORT_CACHE_TTL = int(os.getenv("REPORT_CACHE_TTL", "3600"))
+
+# Finished jobs and their files are deleted after JOB_TTL_SECONDS, and beyond the
+# JOB_MAX_FINISHED most recent ones, by a janitor that runs every JANITOR_INTERVAL seconds
+JOB_TTL_SECONDS = int(os.getenv("JOB_TTL_SECONDS", "86400"))
+JOB_MAX_FINISHED = int(os.getenv("JOB_MAX_FINISHED", "500"))
+JANITOR_INTERVAL = 60
+
+# The janitor also prunes the on-disk LLM caches every LLM_CACHE_SWEEP_INTERVAL seconds,
+# dropping expired entries and the oldest ones beyond LLM_CACHE_MAX_MB
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_MB", "1024")) * 1024 * 1024
+LLM_CACHE_SWEEP_INTERVAL = 3600
+
+class DownloadResponse(FileResponse):
+    """FileResponse that streams large artifacts in 1 MB reads instead of Starlette's 64 KB"""
+    chunk_size = 1024 * 1024
 
 class UploadResponse(BaseModel):
     job_id: str
@@ -61,7 +90,7 @@ class JobStatusResponse(BaseModel):
     summary: Optional[Dict[str, Any]] = None
 
 @app.post("/api/upload", response_model=UploadResponse)
-async def upload_file(background_tasks: BackgroundTasks, files: List[UploadFile] = File(...)):
+async def upload_file(files: List[UploadFile] = File(...)):
     """Upload a ZIP file (single) or multiple UI/source files and start processing."""
     job_id = str(uuid.uuid4())
     if not files:
@@ -93,16 +122,18 @@ async def upload_file(background_tasks: BackgroundTasks, files: List[UploadFile]
                     status_code=400,
                     detail=f"Security validation failed: {', '.join(security_validation['errors'])}"
                 )
-            job = Job(id=job_id, status=JobStatus.UPLOADED)
-            jobs[job_id] = job
-            job.message = "File uploaded and validated successfully"
+            await job_store.create(Job(
+                id=job_id,
+                status=JobStatus.UPLOADED,
+                message="File uploaded and validated successfully"
+            ))
             await telemetry_service.log_event(
                 EventType.FILE_UPLOADED,
                 f"File {file.filename} uploaded successfully",
                 job_id=job_id,
                 data={"filename": file.filename, "size": file.size}
             )
-            background_tasks.add_task(process_job, job_id)
+            await job_queue.put(job_id)
             return UploadResponse(job_id=job_id)
         except HTTPException:
             raise
@@ -126,11 +157,13 @@ async def upload_file(background_tasks: BackgroundTasks, files: List[UploadFile]
         if len(files) > MAX_FILES_COUNT:
             raise HTTPException(status_code=400, detail=f"Too many files. Maximum {MAX_FILES_COUNT} files per upload.")
         await file_service.save_uploaded_files(job_id, files)
-        job = Job(id=job_id, status=JobStatus.UPLOADED)
-        jobs[job_id] = job
-        job.message = f"{len(files)} file(s) uploaded successfully"
+        await job_store.create(Job(
+            id=job_id,
+            status=JobStatus.UPLOADED,
+            message=f"{len(files)} file(s) uploaded successfully"
+        ))
         await telemetry_service.log_event(EventType.FILE_UPLOADED, f"{len(files)} files uploaded", job_id=job_id, data={"count": len(files), "filenames": filenames})
-        background_tasks.add_task(process_job, job_id)
+        await job_queue.put(job_id)
         return UploadResponse(job_id=job_id)
     except HTTPException:
         raise
@@ -143,13 +176,19 @@ async def upload_file(background_tasks: BackgroundTasks, files: List[UploadFile]
         await telemetry_service.end_job_tracking(job_id, False, {"error": str(e)})
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
+async def _job_not_found(job_id: str) -> HTTPException:
+    """404 for unknown jobs, 410 for finished jobs the janitor has already deleted"""
+    if await job_store.evicted(job_id):
+        return HTTPException(status_code=410, detail="Job expired and its results were deleted")
+    return HTTPException(status_code=404, detail="Job not found")
+
 @app.get("/api/status/{job_id}", response_model=JobStatusResponse)
 async def get_job_status(job_id: str):
     """Get job status and progress"""
-    if job_id not in jobs:
-        raise HTTPException(status_code=404, detail="Job not found")
+    job = await job_store.get(job_id)
+    if job is None:
+        raise await _job_not_found(job_id)
     
-    job = jobs[job_id]
     return JobStatusResponse(
         job_id=job_id,
         status=job.status,
@@ -161,10 +200,10 @@ async def get_job_status(job_id: str):
 @app.get("/api/download/{job_id}/fixed.zip")
 async def download_fixed_zip(job_id: str):
     """Download the fixed ZIP file"""
-    if job_id not in jobs:
-        raise HTTPException(status_code=404, detail="Job not found")
+    job = await job_store.get(job_id)
+    if job is None:
+        raise await _job_not_found(job_id)
     
-    job = jobs[job_id]
     if job.status != JobStatus.COMPLETE:
         raise HTTPException(status_code=400, detail="Job not complete")
     
@@ -172,7 +211,7 @@ async def download_fixed_zip(job_id: str):
     if not zip_path.exists():
         raise HTTPException(status_code=404, detail="Fixed ZIP not found")
     
-    return FileResponse(
+    return DownloadResponse(
         path=str(zip_path),
         filename=f"fixed_{job_id}.zip",
         media_type="application/zip"
@@ -181,10 +220,10 @@ async def download_fixed_zip(job_id: str):
 @app.get("/api/download/{job_id}/report.pdf")
 async def download_report_pdf(job_id: str):
     """Download the PDF report"""
-    if job_id not in jobs:
-        raise HTTPException(status_code=404, detail="Job not found")
+    job = await job_store.get(job_id)
+    if job is None:
+        raise await _job_not_found(job_id)
     
-    job = jobs[job_id]
     if job.status != JobStatus.COMPLETE:
         raise HTTPException(status_code=400, detail="Job not complete")
     
@@ -192,7 +231,7 @@ async def download_report_pdf(job_id: str):
     if not pdf_path.exists():
         raise HTTPException(status_code=404, detail="PDF report not found")
     
-    return FileResponse(
+    return DownloadResponse(
         path=str(pdf_path),
         filename=f"report_{job_id}.pdf",
         media_type="application/pdf"
@@ -201,10 +240,10 @@ async def download_report_pdf(job_id: str):
 @app.get("/api/report/{job_id}")
 async def get_job_report(job_id: str):
     """Get detailed job report data for frontend"""
-    if job_id not in jobs:
-        raise HTTPException(status_code=404, detail="Job not found")
+    job = await job_store.get(job_id)
+    if job is None:
+        raise await _job_not_found(job_id)
     
-    job = jobs[job_id]
     if job.status != JobStatus.COMPLETE:
         raise HTTPException(status_code=400, detail="Job not complete")
     
@@ -213,13 +252,38 @@ async def get_job_report(job_id: str):
     if not report_path.exists():
         raise HTTPException(status_code=404, detail="Report data not found")
     
+    async def load_report() -> bytes:
+        async with aiofiles.open(report_path, 'rb') as f:
+            return await f.read()
+    
     try:
-        async with aiofiles.open(report_path, 'r', encoding='utf-8') as f:
-            report_data = json.loads(await f.read())
-        return report_data
+        # report.json is already serialized, so it is passed through without re-parsing
+        content = await response_cache.cached(f"report:{job_id}", REPORT_CACHE_TTL, load_report)
+        return Response(content=content, media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to load report data: {str(e)}")
 
+@app.on_event("startup")
+async def startup():
+    """Start the workers that run uploaded jobs and the janitor that expires finished ones"""
+    if not job_queue.external:
+        await start_job_workers()
+    job_workers.append(asyncio.create_task(_job_janitor()))
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Stop job workers and release pooled connections on shutdown"""
+    for worker in job_workers:
+        worker.cancel()
+    await asyncio.gather(*job_workers, return_exceptions=True)
+    # Only close the agent if job workers created it
+    if get_brain_agent.cache_info().currsize:
+        await get_brain_agent().aclose()
+    await job_store.aclose()
+    await job_queue.aclose()
+    await response_cache.aclose()
+    await telemetry_service.aclose()
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
@@ -228,8 +292,8 @@ async def health_check():
 @app.get("/api/telemetry/{job_id}")
 async def get_job_telemetry(job_id: str):
     """Get telemetry data for a specific job"""
-    if job_id not in jobs:
-        raise HTTPException(status_code=404, detail="Job not found")
+    if not await job_store.exists(job_id):
+        raise await _job_not_found(job_id)
     
     telemetry_data = await telemetry_service.get_job_telemetry(job_id)
     return telemetry_data
@@ -243,8 +307,8 @@ async def get_system_telemetry():
 @app.get("/api/performance/{job_id}")
 async def get_job_performance(job_id: str):
     """Get performance metrics for a specific job"""
-    if job_id not in jobs:
-        raise HTTPException(status_code=404, detail="Job not found")
+    if not await job_store.exists(job_id):
+        raise await _job_not_found(job_id)
     
     performance_data = await performance_service.get_performance_summary(job_id)
     return performance_data
@@ -252,29 +316,108 @@ async def get_job_performance(job_id: str):
 @app.get("/api/security/{job_id}")
 async def get_job_security_report(job_id: str):
     """Get security report for a specific job (from ZIP validation at upload)"""
-    if job_id not in jobs:
-        raise HTTPException(status_code=404, detail="Job not found")
+    if not await job_store.exists(job_id):
+        raise await _job_not_found(job_id)
     
     path = file_service.get_security_validation_path(job_id)
     if not path.exists():
         return {"job_id": job_id, "message": "No security validation data for this job (upload predates this feature)."}
     
-    try:
-        async with aiofiles.open(path, 'r', encoding='utf-8') as f:
-            data = json.loads(await f.read())
+    async def build_report() -> bytes:
+        async with aiofiles.open(path, 'rb') as f:
+            data = orjson.loads(await f.read())
         report = await security_service.create_security_report(
             job_id,
             data.get("files", [])
         )
         report["validation"] = data
-        return report
+        return orjson.dumps(report, default=str)
+    
+    try:
+        # The validation is recorded once at upload, so the built report can be reused
+        content = await response_cache.cached(f"security:{job_id}", REPORT_CACHE_TTL, build_report)
+        return Response(content=content, media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to load security report: {str(e)}")
 
+async def start_job_workers() -> None:
+    """Create the BrainAgent and start JOB_WORKERS tasks that run queued jobs"""
+    # The tokenizer load can hit the network, so keep it off the event loop
+    await asyncio.to_thread(get_brain_agent)
+    for _ in range(int(os.getenv("JOB_WORKERS", "2"))):
+        job_workers.append(asyncio.create_task(_job_worker()))
+
+async def _job_worker():
+    """Run queued jobs one at a time"""
+    while True:
+        job_id, entry_id = await job_queue.get()
+        # Stops other workers from reclaiming the job's stream entry while it runs
+        holder = asyncio.create_task(job_queue.hold(entry_id))
+        try:
+            await process_job(job_id)
+        except asyncio.CancelledError:
+            # Shutdown cut the job off: hand it back instead of acknowledging it as done
+            await _interrupt_job(job_id, entry_id)
+            raise
+        except Exception as e:
+            print(f"Job worker failed on job {job_id}: {e}")
+        finally:
+            holder.cancel()
+        await job_queue.done(entry_id)
+
+async def _interrupt_job(job_id: str, entry_id: Optional[str]):
+    """Requeue a job stopped by shutdown for another worker, or fail it if its queue dies with this process"""
+    try:
+        if job_queue.external:
+            await job_queue.requeue(job_id, entry_id)
+            await job_store.update(
+                job_id,
+                status=JobStatus.UPLOADED,
+                message="Worker restarted; job queued again",
+                progress=0
+            )
+            return
+        await job_store.update(
+            job_id,
+            status=JobStatus.ERROR,
+            message="Processing interrupted by server shutdown",
+            progress=0,
+            completed_at=datetime.now()
+        )
+    except Exception as e:
+        print(f"Failed to release interrupted job {job_id}: {e}")
+
+async def _job_janitor():
+    """Periodically delete finished jobs past their TTL, oldest first beyond JOB_MAX_FINISHED, and prune LLM caches"""
+    last_sweep = time.monotonic() - LLM_CACHE_SWEEP_INTERVAL
+    while True:
+        await asyncio.sleep(JANITOR_INTERVAL)
+        if time.monotonic() - last_sweep >= LLM_CACHE_SWEEP_INTERVAL:
+            last_sweep = time.monotonic()
+            try:
+                pruned = await asyncio.to_thread(prune_llm_cache, LLM_CACHE_MAX_BYTES)
+                if pruned:
+                    print(f"Janitor pruned {pruned} LLM cache entries")
+            except Exception as e:
+                print(f"LLM cache sweep failed: {e}")
+        try:
+            finished = sorted(await job_store.finished_jobs(), key=lambda job: job[1], reverse=True)
+            cutoff = datetime.now() - timedelta(seconds=JOB_TTL_SECONDS)
+            expired = [
+                job_id for index, (job_id, completed_at) in enumerate(finished)
+                if completed_at < cutoff or index >= JOB_MAX_FINISHED
+            ]
+            for job_id in expired:
+                await job_store.evict(job_id)
+                await response_cache.delete(f"report:{job_id}", f"security:{job_id}")
+                await asyncio.to_thread(file_service.delete_job_files, job_id)
+            if expired:
+                print(f"Janitor evicted {len(expired)} finished jobs")
+        except Exception as e:
+            print(f"Job janitor failed: {e}")
+
 async def process_job(job_id: str):
     """Process a job through all stages with performance monitoring and telemetry"""
-    job = jobs[job_id]
-    
     try:
         # Monitor overall job performance
         result = await performance_service.monitor_performance(
@@ -284,10 +427,14 @@ async def process_job(job_id: str):
         )
         
         # Update job with results
-        job.status = JobStatus.COMPLETE
-        job.message = "Processing complete! All fixes applied and validated."
-        job.progress = 100
-        job.summary = result.get("summary", {})
+        await job_store.update(
+            job_id,
+            status=JobStatus.COMPLETE,
+            message="Processing complete! All fixes applied and validated.",
+            progress=100,
+            summary=result.get("summary", {}),
+            completed_at=datetime.now()
+        )
         
         # End job tracking
         await telemetry_service.end_job_tracking(job_id, True, result)
@@ -302,21 +449,26 @@ async def process_job(job_id: str):
             job_id
         )
         
-        job.status = JobStatus.ERROR
-        job.message = f"Processing failed: {str(e)}"
-        job.progress = 0
+        await job_store.update(
+            job_id,
+            status=JobStatus.ERROR,
+            message=f"Processing failed: {str(e)}",
+            progress=0,
+            completed_at=datetime.now()
+        )
         
         # End job tracking with failure
         await telemetry_service.end_job_tracking(job_id, False, {"error": str(e)})
 
 async def _process_job_internal(job_id: str):
     """Internal job processing function for performance monitoring"""
-    job = jobs[job_id]
-    
-    # Stage 1: Brain Agent - Analyze & Detect
-    job.status = JobStatus.PLANNING
-    job.message = "Brain Agent analyzing files and detecting accessibility issues..."
-    job.progress = 20
+    # Stages 1-2: Brain Agent - Analyze & Detect, with POUR agents fixing each batch of issues as it is found
+    await job_store.update(
+        job_id,
+        status=JobStatus.PLANNING,
+        message="Brain Agent analyzing files and detecting accessibility issues...",
+        progress=20
+    )
     
     await telemetry_service.log_event(
         EventType.JOB_STAGE_STARTED,
@@ -325,30 +477,32 @@ async def _process_job_internal(job_id: str):
         data={"stage": "analysis"}
     )
     
-    issues = await brain_agent.analyze_files(job_id)
-    job.summary = {"total_issues": len(issues)}
+    # Detection and fixing overlap, so the number of agent runs grows while issues are found;
+    # progress (20-70) only ever moves forward
+    progress = 20
     
-    await telemetry_service.log_file_processed(job_id, "analysis_complete", len(issues))
+    async def report_agent_done(category: str, done: int, total: int):
+        nonlocal progress
+        progress = max(progress, 20 + 50 * done // total)
+        await job_store.update(
+            job_id,
+            status=JobStatus.FIXING,
+            message=f"POUR agents fixed a batch of {category} issues ({done}/{total} batches done)...",
+            progress=progress
+        )
     
-    # Stage 2: Brain Agent - Coordinate Fixing Process
-    job.status = JobStatus.FIXING
-    job.message = "Brain Agent coordinating POUR agents to fix issues..."
-    job.progress = 40
+    # Brain Agent streams detected issues straight into the POUR agents
+    coordination_results = await get_brain_agent().detect_and_fix(job_id, report_agent_done)
     
-    await telemetry_service.log_event(
-        EventType.JOB_STAGE_STARTED,
-        "Starting issue fixing coordination",
-        job_id=job_id,
-        data={"stage": "fixing", "issues_count": len(issues)}
-    )
-    
-    # Brain Agent coordinates the entire fixing process
-    coordination_results = await brain_agent.coordinate_fixing_process(job_id, issues)
+    await telemetry_service.log_file_processed(job_id, "analysis_complete", coordination_results["total_issues"])
     
     # Stage 3: Validation
-    job.status = JobStatus.VALIDATING
-    job.message = "Validating fixes with ESLint, axe-core, and TypeScript compilation..."
-    job.progress = 80
+    await job_store.update(
+        job_id,
+        status=JobStatus.VALIDATING,
+        message="Validating fixes with ESLint, axe-core, and TypeScript compilation...",
+        progress=80
+    )
     
     await telemetry_service.log_event(
         EventType.JOB_STAGE_STARTED,
@@ -357,11 +511,7 @@ async def _process_job_internal(job_id: str):
         data={"stage": "validation"}
     )
     
-    # Stage 4: Complete
-    job.status = JobStatus.COMPLETE
-    job.message = "Processing complete! All fixes applied and validated."
-    job.progress = 100
-    
+    # Stage 4: Complete; process_job records the final status and summary
     summary = {
         "total_issues": coordination_results["total_issues"],
         "total_fixes": coordination_results["total_fixes"],
@@ -370,8 +520,6 @@ async def _process_job_internal(job_id: str):
         "remaining_issues": coordination_results["validation_results"].get("remaining_issues", 0)
     }
     
-    job.summary.update(summary)
-    
     # Log completion
     await telemetry_service.log_event(
         EventType.JOB_COMPLETED,
@@ -1,6 +1,6 @@
 from enum import Enum
 from typing import Dict, Any, Optional, List
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from datetime import datetime
 
 class JobStatus(str, Enum):
@@ -12,6 +12,9 @@ class JobStatus(str, Enum):
     ERROR = "error"
 
 class Issue(BaseModel):
+    # Issues and fixes are shared between agents and caches, so they are never mutated
+    model_config = ConfigDict(frozen=True)
+
     id: str
     file_path: str
     line_start: int
@@ -27,6 +30,8 @@ class Issue(BaseModel):
     total_lines: Optional[int] = None
 
 class Fix(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     issue_id: str
     file_path: str
     before_code: str
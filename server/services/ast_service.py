@@ -1,10 +1,10 @@
 import os
-import json
 import subprocess
 import tempfile
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Set
 import asyncio
+import orjson
 from models.job import Issue
 from utils.path_utils import get_data_dir
 
@@ -28,12 +28,15 @@ class ASTService:
             env["NODE_PATH"] = str(self._node_path)
         return env
     
-    async def analyze_files_ast(self, job_id: str) -> List[Issue]:
-        """Analyze files using AST parsing for better issue detection"""
+    async def analyze_files_ast(self, job_id: str) -> Tuple[List[Issue], Set[Path]]:
+        """Analyze files using AST parsing, returning the issues and the files the AST covered"""
         job_dir = self.data_dir / job_id
         original_dir = job_dir / "original"
         
         all_issues = []
+        # Files whose AST pass ran the same rules as the regex pass; an empty result can
+        # also mean the parse failed, so only files with findings count as covered
+        covered_paths = set()
         
         # Analyze JavaScript/TypeScript files with Babel
         js_files = []
@@ -41,16 +44,20 @@ class ASTService:
             js_files.extend(original_dir.rglob(ext))
         
         for file_path in js_files:
-            issues = await self._analyze_js_ts_ast(file_path)
+            issues, covered = await self._analyze_js_ts_ast_coverage(file_path)
             all_issues.extend(issues)
+            if covered:
+                covered_paths.add(file_path)
         
         # Analyze CSS files with PostCSS
         css_files = list(original_dir.rglob('*.css'))
         for file_path in css_files:
             issues = await self._analyze_css_ast(file_path)
             all_issues.extend(issues)
+            if issues:
+                covered_paths.add(file_path)
         
-        return all_issues
+        return all_issues, covered_paths
     
     async def analyze_files_ast_batch(self, files: List[Path]) -> List[Issue]:
         """Analyze a batch of files with AST; used by performance_service for optimized processing."""
@@ -70,15 +77,22 @@ class ASTService:
     
     async def _analyze_js_ts_ast(self, file_path: Path) -> List[Issue]:
         """Analyze JS/TS/JSX/TSX files using Babel AST with esprima fallback"""
+        issues, _ = await self._analyze_js_ts_ast_coverage(file_path)
+        return issues
+    
+    async def _analyze_js_ts_ast_coverage(self, file_path: Path) -> Tuple[List[Issue], bool]:
+        """Analyze a JS/TS file, also returning whether Babel's findings cover the regex pass's rules"""
         try:
             # Try Babel first, fallback to esprima if needed
             issues = await self._analyze_with_babel(file_path)
-            if not issues:
-                issues = await self._analyze_with_esprima(file_path)
-            return issues
+            if issues:
+                return issues, True
+            # Esprima only checks aria-required and keyboard-accessible, so its findings
+            # do not replace the regex img-alt, label and heading-order checks
+            return await self._analyze_with_esprima(file_path), False
         except Exception as e:
             print(f"Error analyzing {file_path} with AST: {e}")
-            return []
+            return [], False
     
     async def _analyze_with_babel(self, file_path: Path) -> List[Issue]:
         """Analyze using Babel parser"""
@@ -221,7 +235,7 @@ class ASTService:
                 )
                 
                 if result.returncode == 0:
-                    issues_data = json.loads(result.stdout)
+                    issues_data = orjson.loads(result.stdout)
                     issues = []
                     
                     for issue_data in issues_data:
@@ -363,7 +377,7 @@ class ASTService:
                 )
                 
                 if result.returncode == 0:
-                    issues_data = json.loads(result.stdout)
+                    issues_data = orjson.loads(result.stdout)
                     issues = []
                     
                     for issue_data in issues_data:
@@ -511,7 +525,7 @@ class ASTService:
                 )
                 
                 if result.returncode == 0:
-                    issues_data = json.loads(result.stdout)
+                    issues_data = orjson.loads(result.stdout)
                     issues = []
                     
                     for issue_data in issues_data:
@@ -3,6 +3,9 @@ import re
 from typing import List, Dict, Any, Tuple
 from models.job import Fix
 
+_HUNK_HEADER = re.compile(r'@@ -(\d+),?(\d*) \+(\d+),?(\d*) @@')
+_SCRIPT_TAG = re.compile(r'<script[^>]*>')
+
 class DiffService:
     """Service for generating unified diffs and patch analysis"""
     
@@ -40,7 +43,7 @@ class DiffService:
             for line in diff_lines:
                 if line.startswith('@@'):
                     # Parse hunk header to get line numbers
-                    hunk_match = re.match(r'@@ -(\d+),?(\d*) \+(\d+),?(\d*) @@', line)
+                    hunk_match = _HUNK_HEADER.match(line)
                     if hunk_match:
                         current_line_before = int(hunk_match.group(1))
                         current_line_after = int(hunk_match.group(3))
@@ -83,7 +86,7 @@ class DiffService:
             for line in diff_lines:
                 if line.startswith('@@'):
                     # Parse line numbers from hunk header
-                    hunk_match = re.match(r'@@ -(\d+),?(\d*) \+(\d+),?(\d*) @@', line)
+                    hunk_match = _HUNK_HEADER.match(line)
                     if hunk_match:
                         current_line = int(hunk_match.group(1))
                 elif line.startswith('-'):
@@ -239,10 +242,10 @@ class DiffService:
                 issues.append("Patch removes more than 50% of content")
             
             # Check for common patterns that might be problematic
-            if re.search(r'<script[^>]*>', after_code) and not re.search(r'<script[^>]*>', before_code):
+            if _SCRIPT_TAG.search(after_code) and not _SCRIPT_TAG.search(before_code):
                 issues.append("Patch adds script tags")
             
-            if re.search(r'javascript:', after_code) and not re.search(r'javascript:', before_code):
+            if 'javascript:' in after_code and 'javascript:' not in before_code:
                 issues.append("Patch adds javascript: URLs")
             
             # Calculate safety score
@@ -1,11 +1,12 @@
 import os
 import re
+import asyncio
 import zipfile
 import shutil
-import json
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import aiofiles
+import orjson
 from models.job import Fix
 from utils.path_utils import get_data_dir
 
@@ -22,6 +23,8 @@ MAX_FILES_TOTAL_BYTES = 50 * 1024 * 1024
 MAX_SINGLE_FILE_BYTES = 10 * 1024 * 1024
 # Max number of files when uploading individually
 MAX_FILES_COUNT = 200
+# Uploads are copied to disk in chunks of this size, never read into memory whole
+UPLOAD_CHUNK_BYTES = 16 * 1024 * 1024
 
 
 def _sanitize_filename(name: str) -> str:
@@ -38,6 +41,24 @@ def _sanitize_filename(name: str) -> str:
     return base or "unnamed"
 
 
+def _copy_upload(source, path: Path, limit: Optional[int] = None) -> int:
+    """Copy an upload's file object to path in large chunks, returning its size; stops and deletes path once over limit"""
+    source.seek(0)
+    size = 0
+    with open(path, 'wb') as dst:
+        while True:
+            chunk = source.read(UPLOAD_CHUNK_BYTES)
+            if not chunk:
+                break
+            size += len(chunk)
+            if limit is not None and size > limit:
+                break
+            dst.write(chunk)
+    if limit is not None and size > limit:
+        path.unlink(missing_ok=True)
+    return size
+
+
 class FileService:
     def __init__(self):
         self.data_dir = get_data_dir()
@@ -56,13 +77,6 @@ class FileService:
             ext = Path(file.filename).suffix.lower()
             if ext not in ALLOWED_EXTENSIONS:
                 continue
-            content = await file.read()
-            size = len(content)
-            if size > MAX_SINGLE_FILE_BYTES:
-                raise ValueError(f"File too large: {file.filename} (max {MAX_SINGLE_FILE_BYTES // (1024*1024)}MB)")
-            total_size += size
-            if total_size > MAX_FILES_TOTAL_BYTES:
-                raise ValueError(f"Total upload size exceeds {MAX_FILES_TOTAL_BYTES // (1024*1024)}MB")
             name = _sanitize_filename(file.filename)
             if name in seen_names:
                 seen_names[name] += 1
@@ -71,8 +85,14 @@ class FileService:
             else:
                 seen_names[name] = 1
             path = original_dir / name
-            async with aiofiles.open(path, 'wb') as f:
-                await f.write(content)
+            # Stream from the spooled upload to disk, stopping as soon as either size limit is crossed
+            limit = min(MAX_SINGLE_FILE_BYTES, MAX_FILES_TOTAL_BYTES - total_size)
+            size = await asyncio.to_thread(_copy_upload, file.file, path, limit)
+            if size > MAX_SINGLE_FILE_BYTES:
+                raise ValueError(f"File too large: {file.filename} (max {MAX_SINGLE_FILE_BYTES // (1024*1024)}MB)")
+            total_size += size
+            if total_size > MAX_FILES_TOTAL_BYTES:
+                raise ValueError(f"Total upload size exceeds {MAX_FILES_TOTAL_BYTES // (1024*1024)}MB")
             saved_count += 1
         if saved_count == 0:
             raise ValueError(
@@ -80,23 +100,27 @@ class FileService:
                 "HTML, CSS, JS, JSX, TS, TSX, Java, Kotlin, XML, or images (PNG, JPG, SVG, etc.)."
             )
 
-    async def save_uploaded_file(self, job_id: str, file) -> None:
-        """Save uploaded ZIP file and extract it"""
+    async def save_uploaded_file(self, job_id: str, file) -> Path:
+        """Save uploaded ZIP file and extract it, returning the saved ZIP's path"""
         job_dir = self.data_dir / job_id
         job_dir.mkdir(exist_ok=True)
         
-        # Save uploaded file
+        # Save uploaded file, streaming it from the spooled upload in large chunks
         uploaded_file_path = job_dir / "uploaded.zip"
-        async with aiofiles.open(uploaded_file_path, 'wb') as f:
-            content = await file.read()
-            await f.write(content)
+        await asyncio.to_thread(_copy_upload, file.file, uploaded_file_path)
         
         # Extract ZIP file
         original_dir = job_dir / "original"
         original_dir.mkdir(exist_ok=True)
         
-        with zipfile.ZipFile(uploaded_file_path, 'r') as zip_ref:
-            zip_ref.extractall(original_dir)
+        await asyncio.to_thread(self._extract_zip, uploaded_file_path, original_dir)
+        return uploaded_file_path
+    
+    @staticmethod
+    def _extract_zip(zip_path: Path, target_dir: Path) -> None:
+        """Extract a ZIP archive into target_dir"""
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            zip_ref.extractall(target_dir)
     
     def get_original_files(self, job_id: str) -> List[Path]:
         """Get all original files for analysis with comprehensive validation"""
@@ -213,6 +237,10 @@ class FileService:
         
         return zip_path
     
+    def delete_job_files(self, job_id: str) -> None:
+        """Delete everything stored for a job: uploads, fixed files, ZIP and reports"""
+        shutil.rmtree(self.data_dir / job_id, ignore_errors=True)
+    
     def get_fixed_zip_path(self, job_id: str) -> Path:
         """Get path to fixed ZIP file"""
         return self.data_dir / job_id / "fixed.zip"
@@ -233,13 +261,13 @@ class FileService:
         """Store security validation result for a job (for /api/security/{job_id})"""
         path = self.get_security_validation_path(job_id)
         path.parent.mkdir(parents=True, exist_ok=True)
-        async with aiofiles.open(path, 'w', encoding='utf-8') as f:
-            await f.write(json.dumps(validation, indent=2, default=str))
+        async with aiofiles.open(path, 'wb') as f:
+            await f.write(orjson.dumps(validation, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
     
     async def save_job_metadata(self, job_id: str, metadata: Dict[str, Any]) -> None:
         """Save job metadata to JSON file"""
         job_dir = self.data_dir / job_id
         metadata_path = job_dir / "metadata.json"
         
-        async with aiofiles.open(metadata_path, 'w', encoding='utf-8') as f:
-            await f.write(json.dumps(metadata, indent=2, default=str))
+        async with aiofiles.open(metadata_path, 'wb') as f:
+            await f.write(orjson.dumps(metadata, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
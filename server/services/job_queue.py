@@ -0,0 +1,120 @@
+import os
+import socket
+import asyncio
+from typing import Optional, Tuple
+
+try:
+    import redis.asyncio as aioredis
+    from redis.exceptions import ResponseError
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+
+class JobQueue:
+    """Uploaded job ids waiting to run: in-process, or a Redis stream read by worker.py when JOB_QUEUE=redis"""
+
+    STREAM = "jobs"
+    GROUP = "df-workers"
+    # Safety cap on the stream's length; acknowledged entries are deleted, so only a huge backlog nears it
+    MAX_LEN = 10000
+
+    def __init__(self):
+        self._local: "asyncio.Queue[str]" = asyncio.Queue()
+        self._redis = None
+        self._group_ready = False
+        # Each worker process reads the stream as its own consumer in the group
+        self.consumer = f"{socket.gethostname()}-{os.getpid()}"
+        # Entries left pending this long by a crashed or restarted worker are claimed by another one;
+        # running jobs refresh their claim well within it
+        self.claim_idle_ms = int(os.getenv("JOB_CLAIM_IDLE_SECONDS", "300")) * 1000
+        if os.getenv("JOB_QUEUE", "local").lower() == "redis":
+            redis_url = os.getenv("REDIS_URL", "")
+            if redis_url and REDIS_AVAILABLE:
+                self._redis = aioredis.from_url(redis_url, decode_responses=True)
+            else:
+                print("JOB_QUEUE=redis needs REDIS_URL and the redis package; running jobs in-process")
+
+    @property
+    def external(self) -> bool:
+        """Whether jobs are run by separate worker processes rather than this one"""
+        return self._redis is not None
+
+    async def put(self, job_id: str) -> None:
+        """Queue a job to run"""
+        if self._redis is None:
+            await self._local.put(job_id)
+            return
+        await self._redis.xadd(self.STREAM, {"job_id": job_id}, maxlen=self.MAX_LEN, approximate=True)
+
+    async def get(self) -> Tuple[str, Optional[str]]:
+        """Wait for the next job, returning its id and the stream entry to acknowledge"""
+        if self._redis is None:
+            return await self._local.get(), None
+        await self._ensure_group()
+        while True:
+            # Jobs abandoned by a dead consumer are picked up before new ones
+            claimed = await self._redis.xautoclaim(
+                self.STREAM, self.GROUP, self.consumer, self.claim_idle_ms, count=1
+            )
+            for entry_id, fields in claimed[1]:
+                if fields:
+                    return fields["job_id"], entry_id
+                # The entry was deleted while pending
+                await self.done(entry_id)
+            entries = await self._redis.xreadgroup(
+                self.GROUP, self.consumer, {self.STREAM: ">"}, count=1, block=5000
+            )
+            for _, messages in entries or []:
+                for entry_id, fields in messages:
+                    return fields["job_id"], entry_id
+
+    async def done(self, entry_id: Optional[str]) -> None:
+        """Mark a job taken with get() as finished"""
+        if self._redis is None:
+            self._local.task_done()
+            return
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.xack(self.STREAM, self.GROUP, entry_id)
+            pipe.xdel(self.STREAM, entry_id)
+            await pipe.execute()
+
+    async def hold(self, entry_id: Optional[str]) -> None:
+        """Keep refreshing a running job's claim so other workers do not take its entry as abandoned"""
+        if self._redis is None:
+            return
+        while True:
+            await asyncio.sleep(self.claim_idle_ms / 3000)
+            try:
+                await self._redis.xclaim(self.STREAM, self.GROUP, self.consumer, 0, [entry_id], justid=True)
+            except Exception as e:
+                print(f"Failed to refresh the claim on job entry {entry_id}: {e}")
+
+    async def requeue(self, job_id: str, entry_id: Optional[str]) -> None:
+        """Put a job taken with get() back at the end of the queue"""
+        if self._redis is None:
+            await self._local.put(job_id)
+            self._local.task_done()
+            return
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.xadd(self.STREAM, {"job_id": job_id}, maxlen=self.MAX_LEN, approximate=True)
+            pipe.xack(self.STREAM, self.GROUP, entry_id)
+            pipe.xdel(self.STREAM, entry_id)
+            await pipe.execute()
+
+    async def _ensure_group(self) -> None:
+        """Create the consumer group (and the stream) on first use"""
+        if self._group_ready:
+            return
+        try:
+            await self._redis.xgroup_create(self.STREAM, self.GROUP, id="0", mkstream=True)
+        except ResponseError as e:
+            # Another worker created it first
+            if "BUSYGROUP" not in str(e):
+                raise
+        self._group_ready = True
+
+    async def aclose(self) -> None:
+        """Close the Redis connection pool"""
+        if self._redis is not None:
+            await self._redis.aclose()
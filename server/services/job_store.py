@@ -0,0 +1,183 @@
+import os
+from dataclasses import dataclass
+from datetime import datetime
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+import orjson
+from pydantic import BaseModel
+from models.job import Job, JobStatus
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize the models nested in a summary (e.g. the Fix objects of its agent reports) as dicts"""
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    return str(value)
+
+
+def _encode(field: str, value: Any) -> str:
+    """Serialize a Job field for storage in a Redis hash"""
+    if value is None:
+        return ""
+    if field == "summary":
+        return orjson.dumps(value, default=_json_default).decode("utf-8")
+    if isinstance(value, JobStatus):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _decode(data: Dict[str, str]) -> Job:
+    """Rebuild a Job from the fields of its Redis hash"""
+    return Job(
+        id=data["id"],
+        status=JobStatus(data["status"]),
+        progress=int(data.get("progress") or 0),
+        message=data.get("message", ""),
+        summary=orjson.loads(data["summary"]) if data.get("summary") else None,
+        created_at=datetime.fromisoformat(data["created_at"]),
+        completed_at=datetime.fromisoformat(data["completed_at"]) if data.get("completed_at") else None
+    )
+
+
+@dataclass(slots=True)
+class JobRow:
+    """Compact in-memory status of a job; its summary is kept apart in JobStore._summaries"""
+    status: JobStatus
+    progress: int
+    message: str
+    created_at: datetime
+    completed_at: Optional[datetime] = None
+
+
+class JobStore:
+    """Job status shared by the API and job workers, kept in Redis when REDIS_URL is set"""
+
+    # Fields persisted per job; issues, fixes and validation results live in the job's files
+    FIELDS = ("id", "status", "progress", "message", "summary", "created_at", "completed_at")
+    # How many evicted ids are remembered in memory, and for how long in Redis
+    EVICTED_MEMORY = 10000
+    EVICTED_TTL = 7 * 86400
+
+    def __init__(self):
+        # Slotted rows instead of Job models keep per-job overhead small on long-running
+        # servers; the larger summary dicts only exist for jobs that have one
+        self._jobs: Dict[str, JobRow] = {}
+        self._summaries: Dict[str, Dict[str, Any]] = {}
+        # Ids of recently evicted jobs, so their endpoints answer 410 rather than 404
+        self._evicted: "OrderedDict[str, None]" = OrderedDict()
+        self._redis = None
+        # Redis keys expire a while after the job's last update, outliving the janitor's
+        # JOB_TTL_SECONDS so it still gets to delete the job's files first
+        self.redis_ttl = int(os.getenv("JOB_TTL_SECONDS", "86400")) + 3600
+        redis_url = os.getenv("REDIS_URL", "")
+        if redis_url:
+            if REDIS_AVAILABLE:
+                self._redis = aioredis.from_url(redis_url, decode_responses=True)
+            else:
+                print("REDIS_URL is set but the redis package is not installed; keeping jobs in memory")
+
+    @staticmethod
+    def _key(job_id: str) -> str:
+        """Redis key of a job's hash"""
+        return f"job:{job_id}"
+
+    async def create(self, job: Job) -> None:
+        """Store a new job"""
+        if self._redis is None:
+            self._jobs[job.id] = JobRow(job.status, job.progress, job.message, job.created_at, job.completed_at)
+            if job.summary is not None:
+                self._summaries[job.id] = job.summary
+            return
+        await self._write(job.id, {field: _encode(field, getattr(job, field)) for field in self.FIELDS})
+
+    async def get(self, job_id: str) -> Optional[Job]:
+        """Return the job, or None if it does not exist"""
+        if self._redis is None:
+            row = self._jobs.get(job_id)
+            if row is None:
+                return None
+            return Job(
+                id=job_id,
+                status=row.status,
+                progress=row.progress,
+                message=row.message,
+                summary=self._summaries.get(job_id),
+                created_at=row.created_at,
+                completed_at=row.completed_at
+            )
+        data = await self._redis.hgetall(self._key(job_id))
+        return _decode(data) if data else None
+
+    async def exists(self, job_id: str) -> bool:
+        """Whether a job with this id exists"""
+        if self._redis is None:
+            return job_id in self._jobs
+        return bool(await self._redis.exists(self._key(job_id)))
+
+    async def update(self, job_id: str, **fields: Any) -> None:
+        """Set the given fields on a job in a single write"""
+        if self._redis is None:
+            row = self._jobs.get(job_id)
+            if row is not None:
+                for field, value in fields.items():
+                    if field == "summary":
+                        self._summaries[job_id] = value
+                    else:
+                        setattr(row, field, value)
+            return
+        await self._write(job_id, {field: _encode(field, value) for field, value in fields.items()})
+
+    async def _write(self, job_id: str, mapping: Dict[str, str]) -> None:
+        """Set fields of a job's hash and refresh its expiry in one round trip"""
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.hset(self._key(job_id), mapping=mapping)
+            pipe.expire(self._key(job_id), self.redis_ttl)
+            await pipe.execute()
+
+    async def finished_jobs(self) -> List[Tuple[str, datetime]]:
+        """Ids and completion times of jobs that are complete or failed"""
+        finished = (JobStatus.COMPLETE.value, JobStatus.ERROR.value)
+        if self._redis is None:
+            return [
+                (job_id, row.completed_at) for job_id, row in self._jobs.items()
+                if row.status.value in finished and row.completed_at is not None
+            ]
+        jobs = []
+        async for key in self._redis.scan_iter(match="job:*"):
+            status, completed_at = await self._redis.hmget(key, "status", "completed_at")
+            if status in finished and completed_at:
+                jobs.append((key[len("job:"):], datetime.fromisoformat(completed_at)))
+        return jobs
+
+    async def evict(self, job_id: str) -> None:
+        """Forget a finished job, remembering its id so lookups can report it as gone"""
+        if self._redis is None:
+            self._jobs.pop(job_id, None)
+            self._summaries.pop(job_id, None)
+            self._evicted[job_id] = None
+            if len(self._evicted) > self.EVICTED_MEMORY:
+                self._evicted.popitem(last=False)
+            return
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.delete(self._key(job_id))
+            pipe.set(f"evicted:{job_id}", "1", ex=self.EVICTED_TTL)
+            await pipe.execute()
+
+    async def evicted(self, job_id: str) -> bool:
+        """Whether the job existed but has since been evicted"""
+        if self._redis is None:
+            return job_id in self._evicted
+        return bool(await self._redis.exists(f"evicted:{job_id}"))
+
+    async def aclose(self) -> None:
+        """Close the Redis connection pool"""
+        if self._redis is not None:
+            await self._redis.aclose()
@@ -1,6 +1,8 @@
 import os
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -28,22 +30,49 @@ except ImportError:
 class ReportService:
     def __init__(self):
         self.data_dir = get_data_dir()
+        # Worker processes that render PDFs off the event loop (0 renders on a thread instead)
+        self.pdf_processes = int(os.getenv("REPORT_PDF_PROCESSES", "1"))
+        self._process_pool = None
+    
+    def __getstate__(self):
+        """Pickle without the process pool, so rendering can be sent to the pool's workers"""
+        state = self.__dict__.copy()
+        state["_process_pool"] = None
+        return state
     
     async def generate_pdf_report(self, job_id: str, issues: List[Issue], fixes: List[Fix], validation_results: Dict[str, Any]) -> Path:
         """Generate PDF report with accessibility analysis and fixes"""
-        job_dir = self.data_dir / job_id
-        pdf_path = job_dir / "report.pdf"
-        
-        # Try WeasyPrint first, fallback to reportlab
+        # Layout is CPU-bound and would stall every other request for its duration
+        pool = self._get_process_pool()
+        if pool is None:
+            return await asyncio.to_thread(self._render_pdf, job_id, issues, fixes, validation_results)
+        return await asyncio.get_running_loop().run_in_executor(
+            pool, self._render_pdf, job_id, issues, fixes, validation_results
+        )
+    
+    def _get_process_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Create the PDF rendering process pool on first use"""
+        if self._process_pool is None and self.pdf_processes > 0:
+            self._process_pool = ProcessPoolExecutor(max_workers=self.pdf_processes)
+        return self._process_pool
+    
+    def close(self) -> None:
+        """Shut down the PDF rendering worker processes"""
+        if self._process_pool is not None:
+            self._process_pool.shutdown(cancel_futures=True)
+            self._process_pool = None
+    
+    def _render_pdf(self, job_id: str, issues: List[Issue], fixes: List[Fix], validation_results: Dict[str, Any]) -> Path:
+        """Render the PDF report, trying WeasyPrint first and falling back to reportlab"""
         if WEASYPRINT_AVAILABLE:
             try:
-                return await self._generate_weasyprint_pdf(job_id, issues, fixes, validation_results)
+                return self._generate_weasyprint_pdf(job_id, issues, fixes, validation_results)
             except Exception as e:
                 print(f"WeasyPrint failed, falling back to reportlab: {e}")
         
-        return await self._generate_reportlab_pdf(job_id, issues, fixes, validation_results)
+        return self._generate_reportlab_pdf(job_id, issues, fixes, validation_results)
     
-    async def _generate_weasyprint_pdf(self, job_id: str, issues: List[Issue], fixes: List[Fix], validation_results: Dict[str, Any]) -> Path:
+    def _generate_weasyprint_pdf(self, job_id: str, issues: List[Issue], fixes: List[Fix], validation_results: Dict[str, Any]) -> Path:
         """Generate PDF using WeasyPrint"""
         job_dir = self.data_dir / job_id
         pdf_path = job_dir / "report.pdf"
@@ -62,7 +91,7 @@ class ReportService:
         
         return pdf_path
     
-    async def _generate_reportlab_pdf(self, job_id: str, issues: List[Issue], fixes: List[Fix], validation_results: Dict[str, Any]) -> Path:
+    def _generate_reportlab_pdf(self, job_id: str, issues: List[Issue], fixes: List[Fix], validation_results: Dict[str, Any]) -> Path:
         """Generate PDF using reportlab (fallback)"""
         job_dir = self.data_dir / job_id
         pdf_path = job_dir / "report.pdf"
@@ -0,0 +1,73 @@
+import os
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Optional, Tuple
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+
+class ResponseCache:
+    """Serialized responses of finished jobs, in Redis when REDIS_URL is set and otherwise in a per-process LRU"""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._redis = None
+        self.stats = {"hits": 0, "misses": 0}
+        redis_url = os.getenv("REDIS_URL", "")
+        if redis_url and REDIS_AVAILABLE:
+            self._redis = aioredis.from_url(redis_url)
+
+    async def cached(self, key: str, ttl: int, loader: Callable[[], Awaitable[bytes]]) -> bytes:
+        """Return the bytes cached under key, calling loader and caching its result for ttl seconds on a miss"""
+        value = await self._get(key)
+        if value is not None:
+            self.stats["hits"] += 1
+            return value
+        self.stats["misses"] += 1
+        value = await loader()
+        # A TTL of 0 turns caching off
+        if ttl > 0:
+            await self._set(key, ttl, value)
+        return value
+
+    async def _get(self, key: str) -> Optional[bytes]:
+        """Cached bytes for key, or None on a miss or expired entry"""
+        if self._redis is not None:
+            return await self._redis.get(key)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def _set(self, key: str, ttl: int, value: bytes) -> None:
+        """Cache value under key for ttl seconds"""
+        if self._redis is not None:
+            await self._redis.setex(key, ttl, value)
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        """Drop cached entries, e.g. when their job is evicted"""
+        if self._redis is not None:
+            await self._redis.delete(*keys)
+            return
+        for key in keys:
+            self._entries.pop(key, None)
+
+    async def aclose(self) -> None:
+        """Close the Redis connection pool"""
+        if self._redis is not None:
+            await self._redis.aclose()
@@ -32,6 +32,11 @@ class EventType(Enum):
     PERFORMANCE_METRIC = "performance_metric"
     SECURITY_VIOLATION = "security_violation"
 
+# Telemetry events are appended to disk by a background flusher, at most this many per
+# write and after waiting this long for more events to arrive
+TELEMETRY_FLUSH_BATCH = 100
+TELEMETRY_FLUSH_INTERVAL = 0.05
+
 @dataclass
 class TelemetryEvent:
     """Telemetry event structure"""
@@ -74,6 +79,10 @@ class TelemetryService:
         # Job tracking
         self.active_jobs = {}
         self.job_metrics = {}
+        
+        # Events waiting for the background flusher to append them to the telemetry file
+        self._pending: "asyncio.Queue[TelemetryEvent]" = asyncio.Queue(maxsize=10000)
+        self._flusher: Optional[asyncio.Task] = None
     
     def _setup_logging(self):
         """Setup comprehensive logging configuration"""
@@ -186,20 +195,53 @@ class TelemetryService:
         await self._update_metrics(event)
     
     async def _save_telemetry_event(self, event: TelemetryEvent):
-        """Save telemetry event to file"""
+        """Queue a telemetry event for the background flusher"""
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._flush_events())
+        try:
+            self._pending.put_nowait(event)
+        except asyncio.QueueFull:
+            # The disk cannot keep up; write this one directly rather than block the caller
+            await self._write_events([event])
+    
+    async def _flush_events(self):
+        """Append queued events to the telemetry file in batches, one write per batch"""
+        while True:
+            batch = [await self._pending.get()]
+            try:
+                await asyncio.sleep(TELEMETRY_FLUSH_INTERVAL)
+                while len(batch) < TELEMETRY_FLUSH_BATCH and not self._pending.empty():
+                    batch.append(self._pending.get_nowait())
+            finally:
+                # Taken events are written even when shutdown cancels the wait
+                await self._write_events(batch)
+    
+    async def _write_events(self, events: List[TelemetryEvent]):
+        """Append events to the daily telemetry file"""
         try:
             # Save to daily telemetry file
             today = datetime.now().strftime('%Y%m%d')
             telemetry_file = self.telemetry_dir / f"telemetry_{today}.jsonl"
             
-            event_data = asdict(event)
-            event_line = json.dumps(event_data) + '\n'
+            lines = ''.join(json.dumps(asdict(event)) + '\n' for event in events)
             
             async with aiofiles.open(telemetry_file, 'a', encoding='utf-8') as f:
-                await f.write(event_line)
+                await f.write(lines)
         
         except Exception as e:
-            self.logger.error(f"Failed to save telemetry event: {e}")
+            self.logger.error(f"Failed to save {len(events)} telemetry events: {e}")
+    
+    async def aclose(self):
+        """Stop the flusher and write any events still queued"""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        remaining = []
+        while not self._pending.empty():
+            remaining.append(self._pending.get_nowait())
+        if remaining:
+            await self._write_events(remaining)
     
     async def _update_metrics(self, event: TelemetryEvent):
         """Update internal metrics based on event"""
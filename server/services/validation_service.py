@@ -3,6 +3,7 @@ import subprocess
 import json
 from pathlib import Path
 from typing import List, Dict, Any
+import orjson
 from models.job import ValidationResult
 from utils.path_utils import get_data_dir
 
@@ -79,7 +80,7 @@ class ValidationService:
                         results.append(ValidationResult(file_path=str(file_path), passed=True, errors=[], warnings=[]))
                     else:
                         try:
-                            out = json.loads(proc.stdout)
+                            out = orjson.loads(proc.stdout)
                             errors = [m.get('message', '') for r in out for m in r.get('messages', []) if m.get('severity') == 2]
                             results.append(ValidationResult(file_path=str(file_path), passed=len(errors) == 0, errors=errors, warnings=[]))
                         except (json.JSONDecodeError, TypeError):
@@ -218,7 +219,7 @@ class ValidationService:
                 else:
                     # Parse eslint output
                     try:
-                        eslint_output = json.loads(result.stdout)
+                        eslint_output = orjson.loads(result.stdout)
                         errors = []
                         warnings = []
                         
@@ -312,7 +313,7 @@ class ValidationService:
                 
                 if result.returncode == 0:
                     try:
-                        axe_output = json.loads(result.stdout)
+                        axe_output = orjson.loads(result.stdout)
                         
                         if 'error' in axe_output:
                             results.append(ValidationResult(
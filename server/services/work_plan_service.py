@@ -9,11 +9,14 @@ class WorkPlanService:
     def __init__(self):
         pass
     
-    def generate_work_plan(self, issues: List[Issue]) -> Dict[str, Any]:
+    def generate_work_plan(self, issues: List[Issue], classified_issues: Optional[Dict[str, List[Issue]]] = None) -> Dict[str, Any]:
         """Generate a comprehensive work plan that assigns issues to POUR neurons"""
         
-        # Classify issues by POUR category
-        classified_issues = self._classify_issues_by_pour(issues)
+        # Classify issues by POUR category unless the caller already has them bucketed
+        if classified_issues is None:
+            classified_issues = self._classify_issues_by_pour(issues)
+        else:
+            classified_issues = self._add_inferred_issues(issues, classified_issues)
         
         # Calculate priorities and estimated times
         work_plan = {
@@ -64,6 +67,21 @@ class WorkPlanService:
         
         return classified
     
+    def _add_inferred_issues(self, issues: List[Issue], classified_issues: Dict[str, List[Issue]]) -> Dict[str, List[Issue]]:
+        """Complete a caller's classification, which only buckets canonical categories, with inferred ones"""
+        classified = {
+            category: list(classified_issues.get(category, []))
+            for category in ("perceivable", "operable", "understandable", "robust")
+        }
+        
+        for issue in issues:
+            if issue.category not in classified:
+                category = self._infer_category_from_issue(issue)
+                if category in classified:
+                    classified[category].append(issue)
+        
+        return classified
+    
     def _infer_category_from_issue(self, issue: Issue) -> str:
         """Infer POUR category from issue content when not explicitly set"""
         description_lower = issue.description.lower()
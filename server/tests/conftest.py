@@ -0,0 +1,5 @@
+import os
+import tempfile
+
+# Some modules create their data directories on import, so keep them out of the working tree
+os.environ.setdefault("DATA_DIR", tempfile.mkdtemp(prefix="df-infoui-tests-"))
@@ -0,0 +1,31 @@
+from agents._diff import create_diff
+
+
+def test_diff_of_a_changed_line():
+    """Changed lines are shown with one line of context"""
+    before = "<ul>\n<li>a</li>\n<img src=\"a.png\">\n<li>b</li>\n</ul>"
+    after = "<ul>\n<li>a</li>\n<img alt=\"A\" src=\"a.png\">\n<li>b</li>\n</ul>"
+
+    assert create_diff(before, after).split("\n") == [
+        "--- ",
+        "+++ ",
+        "@@ -2,3 +2,3 @@",
+        " <li>a</li>",
+        "-<img src=\"a.png\">",
+        "+<img alt=\"A\" src=\"a.png\">",
+        " <li>b</li>",
+    ]
+
+
+def test_diff_of_added_lines():
+    """Lines added after the snippet show up as additions"""
+    assert create_diff("<p>x</p>", "<p>x</p>\n<p>y</p>").split("\n")[2:] == [
+        "@@ -1 +1,2 @@",
+        " <p>x</p>",
+        "+<p>y</p>",
+    ]
+
+
+def test_diff_of_unchanged_code_is_empty():
+    """Identical snippets have no diff"""
+    assert create_diff("<p>x</p>", "<p>x</p>") == ""
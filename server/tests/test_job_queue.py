@@ -0,0 +1,44 @@
+import asyncio
+from services.job_queue import JobQueue
+
+
+def test_local_queue_runs_jobs_in_order(monkeypatch):
+    """Without JOB_QUEUE=redis jobs are queued in-process, first in first out"""
+    monkeypatch.delenv("JOB_QUEUE", raising=False)
+
+    async def run():
+        queue = JobQueue()
+        await queue.put("job-1")
+        await queue.put("job-2")
+        taken = [await queue.get(), await queue.get()]
+        for _, entry_id in taken:
+            await queue.done(entry_id)
+        return queue.external, taken
+
+    external, taken = asyncio.run(run())
+
+    assert not external
+    assert taken == [("job-1", None), ("job-2", None)]
+
+
+def test_local_queue_requeues_at_the_end(monkeypatch):
+    """A requeued job runs after the jobs already waiting"""
+    monkeypatch.delenv("JOB_QUEUE", raising=False)
+
+    async def run():
+        queue = JobQueue()
+        await queue.put("job-1")
+        await queue.put("job-2")
+        job_id, entry_id = await queue.get()
+        await queue.requeue(job_id, entry_id)
+        return [(await queue.get())[0] for _ in range(2)]
+
+    assert asyncio.run(run()) == ["job-2", "job-1"]
+
+
+def test_redis_queue_needs_redis_url(monkeypatch):
+    """JOB_QUEUE=redis without REDIS_URL falls back to the in-process queue"""
+    monkeypatch.setenv("JOB_QUEUE", "redis")
+    monkeypatch.delenv("REDIS_URL", raising=False)
+
+    assert not JobQueue().external
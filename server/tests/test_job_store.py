@@ -0,0 +1,80 @@
+import asyncio
+from datetime import datetime
+from models.job import Job, JobStatus, Fix
+from services.job_store import JobStore, _encode, _decode
+
+
+def _fix() -> Fix:
+    """A fix as the POUR agents report it in a job summary"""
+    return Fix(
+        issue_id="issue-1",
+        file_path="src/App.jsx",
+        before_code="<img src='a.png'>",
+        after_code="<img alt=\"Logo\" src='a.png'>",
+        diff="-<img src='a.png'>\n+<img alt=\"Logo\" src='a.png'>",
+        confidence=0.9,
+        applied=True,
+        line_start=3,
+        line_end=3
+    )
+
+
+def test_redis_encoding_round_trips_a_completed_job():
+    """Every field survives _encode/_decode, including Fix models nested in the summary"""
+    fix = _fix()
+    job = Job(
+        id="job-1",
+        status=JobStatus.COMPLETE,
+        progress=100,
+        message="done",
+        summary={"total_issues": 1, "agent_reports": {"perceivable": {"fixes_count": 1, "fixes": [fix]}}},
+        created_at=datetime(2024, 1, 2, 3, 4, 5),
+        completed_at=datetime(2024, 1, 2, 3, 5, 0)
+    )
+
+    decoded = _decode({field: _encode(field, getattr(job, field)) for field in JobStore.FIELDS})
+
+    assert decoded.id == job.id
+    assert decoded.status == JobStatus.COMPLETE
+    assert decoded.progress == 100
+    assert decoded.message == "done"
+    assert decoded.created_at == job.created_at
+    assert decoded.completed_at == job.completed_at
+    assert decoded.summary["agent_reports"]["perceivable"]["fixes"] == [fix.model_dump()]
+
+
+def test_redis_encoding_of_a_new_job():
+    """Unset optional fields are stored empty and decode back to None"""
+    job = Job(id="job-2", status=JobStatus.UPLOADED, created_at=datetime(2024, 1, 2))
+
+    decoded = _decode({field: _encode(field, getattr(job, field)) for field in JobStore.FIELDS})
+
+    assert decoded.summary is None
+    assert decoded.completed_at is None
+    assert decoded.status == JobStatus.UPLOADED
+
+
+def test_memory_store_evicts_finished_jobs(monkeypatch):
+    """Finished jobs are listed for the janitor, and evicted ones are remembered as gone"""
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    store = JobStore()
+    done_at = datetime(2024, 1, 2, 3, 5, 0)
+
+    async def run():
+        await store.create(Job(id="done", status=JobStatus.UPLOADED))
+        await store.create(Job(id="running", status=JobStatus.UPLOADED))
+        await store.update("done", status=JobStatus.COMPLETE, progress=100, summary={"total_issues": 0}, completed_at=done_at)
+        await store.update("running", status=JobStatus.FIXING, progress=50)
+        finished = await store.finished_jobs()
+        job = await store.get("done")
+        await store.evict("done")
+        return finished, job, await store.get("done"), await store.evicted("done"), await store.evicted("running")
+
+    finished, job, after, evicted, running_evicted = asyncio.run(run())
+
+    assert finished == [("done", done_at)]
+    assert job.status == JobStatus.COMPLETE
+    assert job.summary == {"total_issues": 0}
+    assert after is None
+    assert evicted
+    assert not running_evicted
@@ -0,0 +1,67 @@
+from pathlib import Path
+import orjson
+from agents.brain_agent import BrainAgent
+
+
+def test_malformed_issues_are_skipped_individually():
+    """One bad entry in a multi-file LLM response does not discard the other files' issues"""
+    # Parsing needs no client or tokenizer, so they are never set up
+    agent = BrainAgent.__new__(BrainAgent)
+    files = [(Path("/data/job/original/a.html"), "<img>"), (Path("/data/job/original/b.jsx"), "<div onClick={go}>")]
+    issue = {
+        "id": "issue_1",
+        "line_start": 1,
+        "line_end": 1,
+        "category": "perceivable",
+        "severity": "high",
+        "description": "Image missing alt attribute",
+        "code_snippet": "<img>",
+        "rule_id": "img-alt"
+    }
+    result = orjson.dumps({"results": [
+        {"file_id": 0, "issues": [issue, {"id": "issue_2", "line_start": "top"}, "not an issue"]},
+        {"file_id": 1, "issues": [{**issue, "category": "operable", "code_snippet": "<div onClick={go}>"}]},
+        {"file_id": 7, "issues": [issue]},
+        "not a result"
+    ]}).decode("utf-8")
+
+    issues = agent._parse_llm_result(files, result)
+
+    assert [(issue.file_path, issue.category) for issue in issues] == [
+        ("/data/job/original/a.html", "perceivable"),
+        ("/data/job/original/b.jsx", "operable"),
+    ]
+
+
+def test_unloadable_tokenizer_falls_back_to_characters(monkeypatch):
+    """A model tiktoken doesn't know, with no cached encoding to fall back on, truncates by characters"""
+    import agents.brain_agent as brain_agent
+    def offline(name):
+        raise ConnectionError(f"cannot download {name}")
+    def unknown(model):
+        raise KeyError(model)
+    monkeypatch.setattr(brain_agent.tiktoken, "encoding_for_model", unknown)
+    monkeypatch.setattr(brain_agent.tiktoken, "get_encoding", offline)
+    agent = BrainAgent.__new__(BrainAgent)
+    agent.model = "gpt-5.1"
+
+    assert agent._load_encoding() is None
+
+
+def test_aclose_closes_the_pour_agents():
+    """Shutting the agent down also closes the POUR agents' shared LLM client"""
+    import asyncio
+    closed = []
+    class Closable:
+        def __init__(self, name):
+            self.name = name
+        async def aclose(self):
+            closed.append(self.name)
+    agent = BrainAgent.__new__(BrainAgent)
+    agent._http = Closable("http")
+    agent._process_pool = None
+    agent.pour_agents = Closable("pour_agents")
+
+    asyncio.run(agent.aclose())
+
+    assert closed == ["http", "pour_agents"]
@@ -0,0 +1,71 @@
+import os
+import time
+import asyncio
+from agents._llm_cache import LLMCache, MemoryLRUCache, prune_llm_cache
+
+
+def test_llm_cache_round_trip(monkeypatch, tmp_path):
+    """Values are stored on disk and read back by key"""
+    monkeypatch.setenv("DATA_DIR", str(tmp_path))
+    cache = LLMCache("test")
+    key = LLMCache.make_key("prompt", "model", "content")
+
+    async def run():
+        assert await cache.get(key) is None
+        await cache.set(key, {"issues": [{"line": 3}]})
+        return await cache.get(key)
+
+    assert asyncio.run(run()) == {"issues": [{"line": 3}]}
+    assert cache.stats == {"hits": 1, "misses": 1}
+
+
+def test_llm_cache_deletes_expired_entries_on_read(monkeypatch, tmp_path):
+    """An expired entry is a miss and its file is removed"""
+    monkeypatch.setenv("DATA_DIR", str(tmp_path))
+    cache = LLMCache("test", ttl=-1)
+
+    async def run():
+        await cache.set("key", "value")
+        return await cache.get("key")
+
+    assert asyncio.run(run()) is None
+    assert not (cache.cache_dir / "key.json").exists()
+
+
+def test_prune_llm_cache(monkeypatch, tmp_path):
+    """Pruning removes expired entries, stale temp files and the oldest entries beyond the cap"""
+    monkeypatch.setenv("DATA_DIR", str(tmp_path))
+    live = LLMCache("live")
+    expired = LLMCache("expired", ttl=-1)
+
+    async def fill():
+        for index in range(4):
+            await live.set(f"k{index}", "x" * 100)
+            # Older entries have older modification times
+            path = live.cache_dir / f"k{index}.json"
+            os.utime(path, (time.time() - 100 + index,) * 2)
+        await expired.set("old", "x")
+
+    asyncio.run(fill())
+    stale = live.cache_dir / "k9.abc.tmp"
+    stale.write_text("partial")
+    os.utime(stale, (0, 0))
+    newest_size = sum((live.cache_dir / f"k{index}.json").stat().st_size for index in (2, 3))
+
+    assert prune_llm_cache(newest_size) == 4
+    assert sorted(path.name for path in live.cache_dir.iterdir()) == ["k2.json", "k3.json"]
+    assert list(expired.cache_dir.iterdir()) == []
+
+
+def test_memory_lru_evicts_least_recently_used():
+    """The entry not read for longest is evicted when the cache is full"""
+    cache = MemoryLRUCache(maxsize=2)
+
+    async def run():
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")
+        await cache.set("c", 3)
+        return [await cache.get(key) for key in ("a", "b", "c")]
+
+    assert asyncio.run(run()) == [1, None, 3]
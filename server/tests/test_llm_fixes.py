@@ -0,0 +1,48 @@
+import asyncio
+from models.job import Issue
+from agents import _llm
+from agents._llm import MAX_SNIPPET_CHARS, request_fixes
+from agents._llm_cache import MemoryLRUCache
+
+
+def _issue(file_path: str, code: str) -> Issue:
+    """An LLM-detected issue; the LLM reuses ids like issue_1 in every response"""
+    return Issue(
+        id="issue_1",
+        file_path=file_path,
+        line_start=1,
+        line_end=1,
+        category="perceivable",
+        severity="medium",
+        description="List needs an accessible name",
+        code_snippet=code,
+        rule_id="list-label"
+    )
+
+
+def test_fixes_are_matched_to_issues_by_position(monkeypatch):
+    """Issues sharing an id each get the fix for their own snippet, and skipped ones get None"""
+    monkeypatch.setattr(_llm, "fix_cache", MemoryLRUCache())
+    requested = []
+
+    async def fake_batches(client, model, category, groups, batch_size, sem):
+        requested.extend(group[0].code_snippet for _, group in groups)
+        return {
+            key: {"before_code": group[0].code_snippet, "after_code": group[0].code_snippet + "<!-- fixed -->", "confidence": 0.9}
+            for key, group in groups
+        }
+
+    monkeypatch.setattr(_llm, "_request_fix_batches", fake_batches)
+    issues = [
+        _issue("a.html", "<ul>"),
+        _issue("big.html", "x" * MAX_SNIPPET_CHARS),
+        _issue("b.html", "<ol>"),
+        _issue("c.html", "<ul>"),
+    ]
+
+    fixes = asyncio.run(request_fixes(None, "model", "perceivable", issues, 10, asyncio.Semaphore(1)))
+
+    assert [fix and fix["before_code"] for fix in fixes] == ["<ul>", None, "<ol>", "<ul>"]
+    assert fixes[2]["after_code"] == "<ol><!-- fixed -->"
+    # Identical snippets share one answer
+    assert requested == ["<ul>", "<ol>"]
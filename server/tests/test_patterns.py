@@ -0,0 +1,44 @@
+import pytest
+from models.job import Issue
+from agents._rules import pattern_fix
+
+
+def _issue(category: str, rule_id: str, code: str, description: str = "Accessibility issue") -> Issue:
+    """An issue flagged on a one-line snippet"""
+    return Issue(
+        id="issue-1",
+        file_path="src/index.html",
+        line_start=4,
+        line_end=4,
+        category=category,
+        severity="high",
+        description=description,
+        code_snippet=code,
+        rule_id=rule_id
+    )
+
+
+@pytest.mark.parametrize("rule_id, description, code, expected", [
+    ("image-alt", "Image has no text alternative", '<img src="a.png">', '<img alt="Descriptive text for image" src="a.png">'),
+    ("html-has-lang", "Page language (3.1.1) is not set", "<html>", '<html lang="en">'),
+    ("click-events", "Clickable element is not keyboard accessible", "<div onClick={go}>Go</div>", '<div role="button" tabIndex={0} onClick={go}>Go</div>'),
+    ("click-events", "Clickable element is not keyboard accessible", '<span onclick="go()">Go</span>', '<span role="button" tabindex="0" onclick="go()">Go</span>'),
+])
+def test_pattern_fixes(rule_id, description, code, expected):
+    """Patterns rewrite snippets whose issue mentions one of their keywords"""
+    fix = pattern_fix(_issue("robust", rule_id, code, description))
+
+    assert fix.after_code == expected
+    assert fix.before_code == code
+
+
+@pytest.mark.parametrize("rule_id, description, code", [
+    # The snippet matches a pattern, but the issue is about something else
+    ("color-contrast", "Insufficient contrast", '<img src="a.png">'),
+    # The issue matches, but the snippet already has the attribute
+    ("image-alt", "Image has no text alternative", '<img alt="" src="a.png">'),
+    ("click-events", "Clickable element is not keyboard accessible", '<div role="link" onClick={go}>Go</div>'),
+])
+def test_pattern_fixes_leave_other_issues_to_the_llm(rule_id, description, code):
+    """No pattern applies, so the issue goes to the LLM"""
+    assert pattern_fix(_issue("robust", rule_id, code, description)) is None
@@ -0,0 +1,58 @@
+import asyncio
+from services.response_cache import ResponseCache
+
+
+def _loader(value: bytes):
+    """Response loader returning value"""
+    async def load():
+        return value
+    return load
+
+
+def test_response_cache_calls_loader_once(monkeypatch):
+    """A cached response is served without rebuilding it"""
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    cache = ResponseCache()
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        return b"report"
+
+    async def run():
+        return [await cache.cached("report:1", 60, loader) for _ in range(3)]
+
+    assert asyncio.run(run()) == [b"report"] * 3
+    assert len(calls) == 1
+
+
+def test_response_cache_ttl_zero_disables_caching(monkeypatch):
+    """With a TTL of 0 every request rebuilds the response"""
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    cache = ResponseCache()
+    calls = []
+
+    async def loader():
+        calls.append(1)
+        return b"report"
+
+    async def run():
+        for _ in range(2):
+            await cache.cached("report:1", 0, loader)
+
+    asyncio.run(run())
+    assert len(calls) == 2
+
+
+def test_response_cache_lru_and_delete(monkeypatch):
+    """The oldest response is evicted beyond maxsize, and deleted keys are rebuilt"""
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    cache = ResponseCache(maxsize=2)
+
+    async def run():
+        for key in ("a", "b", "c"):
+            await cache.cached(key, 60, _loader(key.encode()))
+        await cache.delete("c")
+        return [await cache._get(key) for key in ("a", "b", "c")]
+
+    assert asyncio.run(run()) == [None, b"b", None]
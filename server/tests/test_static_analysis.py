@@ -0,0 +1,103 @@
+import re
+from pathlib import Path
+import pytest
+from agents import _static_analysis
+from agents._static_analysis import analyze_content
+
+JSX = b"""export const Form = () => (
+  <div>
+    <h1>Sign up</h1>
+    <img src="logo.png">
+    <img src="photo.png" alt="Team">
+    <h3>Details</h3>
+    <input type="text" />
+    <input type="email" aria-label="Email" />
+    <label>Name <input type="text" /></label>
+  </div>
+);
+"""
+
+
+@pytest.fixture(params=["re", "re2"])
+def scan_engine(request, monkeypatch):
+    """Run the whole-file scans on stdlib re and, when it is installed, on RE2"""
+    engine = re if request.param == "re" else pytest.importorskip("re2")
+    for name in ("_HTML_COMBINED", "_ONCLICK"):
+        pattern = getattr(_static_analysis, name)
+        monkeypatch.setattr(_static_analysis, name, engine.compile(pattern.pattern))
+    return request.param
+
+
+def _found(issues):
+    """(rule_id, line, snippet) of each issue"""
+    return [(issue.rule_id, issue.line_start, issue.code_snippet) for issue in issues]
+
+
+def test_jsx_analysis(scan_engine):
+    """Images without alt, unlabelled inputs and skipped heading levels are flagged on their line"""
+    assert _found(analyze_content(Path("Form.jsx"), JSX)) == [
+        ("img-alt", 4, '<img src="logo.png">'),
+        ("heading-order", 6, "<h3>Details</h3>"),
+        ("label", 7, '<input type="text" />'),
+    ]
+
+
+def test_html_regex_fallback(scan_engine, monkeypatch):
+    """Without lxml, HTML files get the same regex scan as JSX"""
+    monkeypatch.setattr(_static_analysis, "LXML_AVAILABLE", False)
+    content = b'<html>\n<body>\n<h2>Title</h2>\n<h4>Sub</h4>\n<img src="a.png">\n</body>\n</html>\n'
+
+    assert _found(analyze_content(Path("index.html"), content)) == [
+        ("heading-order", 4, "<h4>Sub</h4>"),
+        ("img-alt", 5, '<img src="a.png">'),
+    ]
+
+
+def test_html_analysis_with_lxml():
+    """Parsed HTML honours <label for=...> and wrapping labels"""
+    pytest.importorskip("lxml")
+    content = b"""<html>
+<body>
+<h1>Title</h1>
+<h3>Skipped</h3>
+<img src="a.png">
+<label for="name">Name</label>
+<input id="name" type="text">
+<label>Email <input type="email"></label>
+<input type="search">
+</body>
+</html>
+"""
+
+    assert _found(analyze_content(Path("index.html"), content)) == [
+        ("img-alt", 5, '<img src="a.png">'),
+        ("label", 9, '<input type="search">'),
+        ("heading-order", 4, "<h3>Skipped</h3>"),
+    ]
+
+
+def test_js_analysis(scan_engine):
+    """Each line with an onClick element but no aria-label is flagged once"""
+    content = b"""const a = <div onClick={go}>Go</div>;
+const b = <div aria-label="Stop" onClick={stop}>Stop</div>;
+const c = <span onClick={x}>x</span><span onClick={y}>y</span>;
+"""
+
+    assert _found(analyze_content(Path("app.js"), content)) == [
+        ("aria-label", 1, "const a = <div onClick={go}>Go</div>;"),
+        ("aria-label", 3, "const c = <span onClick={x}>x</span><span onClick={y}>y</span>;"),
+    ]
+
+
+def test_css_analysis():
+    """Color declarations without a background on the same line are flagged"""
+    content = b".a { color: #777; }\n.b { color: #000; background: #fff; }\n"
+
+    assert _found(analyze_content(Path("site.css"), content)) == [
+        ("color-contrast", 1, ".a { color: #777; }"),
+    ]
+
+
+def test_unsupported_files_are_skipped():
+    """Files without an analyzer yield no issues"""
+    assert analyze_content(Path("README.md"), b"<img src=a.png>") == []
@@ -0,0 +1,83 @@
+import asyncio
+from types import SimpleNamespace
+import pytest
+from agents.brain_agent import BrainAgent
+
+
+class FakeStream:
+    """Chat completion stream yielding the given content deltas"""
+
+    def __init__(self, deltas):
+        self.deltas = deltas
+        self.consumed = 0
+        self.closed = False
+
+    def __aiter__(self):
+        return self._chunks()
+
+    async def _chunks(self):
+        for delta in self.deltas:
+            self.consumed += 1
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=delta))])
+
+    async def close(self):
+        self.closed = True
+
+
+def _complete(deltas):
+    """Run _stream_json_completion over a fake stream, returning the result and the stream"""
+    stream = FakeStream(deltas)
+    # Only the completion call is needed, so the client and tokenizer are never set up
+    agent = BrainAgent.__new__(BrainAgent)
+
+    async def create_completion(request):
+        return stream
+
+    agent._create_completion = create_completion
+    return asyncio.run(agent._stream_json_completion({})), stream
+
+
+def test_object_split_across_chunks():
+    """Deltas are joined until the top-level object closes"""
+    result, stream = _complete(['  {"issues": [{"line"', ': 3}', ']}'])
+
+    assert result == '  {"issues": [{"line": 3}]}'
+    assert stream.closed
+
+
+def test_stops_at_the_closing_brace():
+    """Text after the object is dropped and the rest of the stream is not read"""
+    result, stream = _complete(['{"a": {"b": 1}} trailing', ' more', ' text'])
+
+    assert result == '{"a": {"b": 1}}'
+    assert stream.consumed == 1
+    assert stream.closed
+
+
+def test_braces_and_escaped_quotes_inside_strings():
+    """Braces within string literals, including after escaped quotes, do not end the object"""
+    content = '{"code": "<div style=\\"x\\">}{</div>", "path": "C:\\\\dir\\\\"}'
+    result, _ = _complete([content[:12], content[12:20], content[20:], "ignored"])
+
+    assert result == content
+
+
+def test_skips_empty_deltas():
+    """Chunks without content, e.g. the role-only first chunk, are ignored"""
+    result, _ = _complete([None, "", "{}", None])
+
+    assert result == "{}"
+
+
+def test_rejects_text_before_the_object():
+    """A reply that does not start with an object is cut off right away"""
+    with pytest.raises(ValueError):
+        _complete(["Sure! Here is the JSON: {", "}"])
+
+
+def test_returns_an_unterminated_object_as_is():
+    """A stream that ends early returns what arrived, leaving the parse error to the caller"""
+    result, stream = _complete(['{"issues": ['])
+
+    assert result == '{"issues": ['
+    assert stream.closed
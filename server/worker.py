@@ -0,0 +1,22 @@
+import asyncio
+import main
+
+
+async def run() -> None:
+    """Run queued jobs from the Redis stream until interrupted"""
+    if not main.job_queue.external:
+        raise SystemExit("worker.py needs JOB_QUEUE=redis and REDIS_URL so it can share jobs with the API")
+    await main.start_job_workers()
+    print(f"Job worker {main.job_queue.consumer} running {len(main.job_workers)} job slots")
+    try:
+        await asyncio.gather(*main.job_workers)
+    finally:
+        await main.shutdown()
+
+
+if __name__ == "__main__":
+    # Runs jobs apart from the API process so heavy stages never stall request handling
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass